@@ -0,0 +1,71 @@
+"""prefixed_id_c_collation
+
+Revision ID: 3c1f7a9d2e54
+Revises: 9eef91f86ba6
+Create Date: 2026-10-15 22:40:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9d2e54'
+down_revision: Union[str, Sequence[str], None] = '9eef91f86ba6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (表名, 列名, 是否可空)：带前缀 ID 的主键及引用它的外键
+PREFIXED_ID_COLUMNS = [
+    ('projects', 'id', False),
+    ('sessions', 'id', False),
+    ('sessions', 'project_id', False),
+    ('questions', 'id', False),
+    ('questions', 'project_id', False),
+    ('analysis_documents', 'id', False),
+    ('analysis_documents', 'project_id', False),
+    ('learning_records', 'id', False),
+    ('learning_records', 'session_id', False),
+    ('learning_records', 'question_id', False),
+    ('notes', 'id', False),
+    ('notes', 'session_id', False),
+    ('notes', 'question_id', True),
+]
+
+
+def _is_postgresql() -> bool:
+    """排序规则调整仅适用于 PostgreSQL"""
+    from alembic import context
+    return context.get_context().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _is_postgresql():
+        return
+    
+    for table, column, nullable in PREFIXED_ID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=50),
+            type_=sa.String(length=50, collation='C'),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_postgresql():
+        return
+    
+    for table, column, nullable in reversed(PREFIXED_ID_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=50, collation='C'),
+            type_=sa.String(length=50),
+            existing_nullable=nullable,
+        )
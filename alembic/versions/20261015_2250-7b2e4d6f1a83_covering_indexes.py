@@ -0,0 +1,53 @@
+"""covering_indexes
+
+Revision ID: 7b2e4d6f1a83
+Revises: 3c1f7a9d2e54
+Create Date: 2026-10-15 22:50:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4d6f1a83'
+down_revision: Union[str, Sequence[str], None] = '3c1f7a9d2e54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('questions', schema=None) as batch_op:
+        batch_op.drop_index('ix_questions_project_id')
+        batch_op.drop_index('ix_questions_project_stage')
+        batch_op.create_index(
+            'ix_questions_project_stage_order',
+            ['project_id', 'stage', 'order_index'],
+            unique=False,
+            postgresql_include=['title', 'difficulty'],
+        )
+
+    with op.batch_alter_table('learning_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_learning_records_session_id')
+        batch_op.drop_index('ix_learning_records_session_question')
+        batch_op.create_index(
+            'ix_learning_records_session_question',
+            ['session_id', 'question_id'],
+            unique=False,
+            postgresql_include=['score', 'is_correct'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('learning_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_learning_records_session_question')
+        batch_op.create_index('ix_learning_records_session_question', ['session_id', 'question_id'], unique=False)
+        batch_op.create_index('ix_learning_records_session_id', ['session_id'], unique=False)
+
+    with op.batch_alter_table('questions', schema=None) as batch_op:
+        batch_op.drop_index('ix_questions_project_stage_order')
+        batch_op.create_index('ix_questions_project_stage', ['project_id', 'stage'], unique=False)
+        batch_op.create_index('ix_questions_project_id', ['project_id'], unique=False)
@@ -0,0 +1,48 @@
+"""jsonb_external_storage
+
+Revision ID: 9d4a2c7e5b16
+Revises: 7b2e4d6f1a83
+Create Date: 2026-10-15 23:00:08.551740
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a2c7e5b16'
+down_revision: Union[str, Sequence[str], None] = '7b2e4d6f1a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 体积大、一次写入后整体读取的 JSONB 列
+EXTERNAL_STORAGE_COLUMNS = [
+    ('projects', 'profile'),
+    ('projects', 'repo_map'),
+]
+
+
+def _is_postgresql() -> bool:
+    """STORAGE 设置仅适用于 PostgreSQL"""
+    from alembic import context
+    return context.get_context().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _is_postgresql():
+        return
+    
+    for table, column in EXTERNAL_STORAGE_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_postgresql():
+        return
+    
+    for table, column in EXTERNAL_STORAGE_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED')
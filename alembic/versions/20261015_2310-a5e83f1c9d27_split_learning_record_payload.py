@@ -0,0 +1,103 @@
+"""split_learning_record_payload
+
+Revision ID: a5e83f1c9d27
+Revises: 9d4a2c7e5b16
+Create Date: 2026-10-15 23:10:44.127093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Text
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e83f1c9d27'
+down_revision: Union[str, Sequence[str], None] = '9d4a2c7e5b16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _dialect_name() -> str:
+    from alembic import context
+    return context.get_context().dialect.name
+
+
+def get_json_type():
+    """根据数据库方言返回合适的 JSON 类型"""
+    if _dialect_name() == 'postgresql':
+        from sqlalchemy.dialects.postgresql import JSONB
+        return JSONB(astext_type=Text())
+    else:
+        return sa.JSON()
+
+
+def get_prefixed_id_type():
+    """带前缀 ID 列类型（PostgreSQL 上使用 C 排序规则）"""
+    if _dialect_name() == 'postgresql':
+        return sa.String(length=50, collation='C')
+    return sa.String(length=50)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    json_type = get_json_type()
+    
+    op.create_table('learning_record_payloads',
+    sa.Column('record_id', get_prefixed_id_type(), nullable=False, comment='关联的学习记录 ID'),
+    sa.Column('answer', sa.Text(), nullable=True, comment='用户的回答内容'),
+    sa.Column('evaluation', json_type, nullable=True, comment='评估结果 JSON，包含各要点的匹配情况'),
+    sa.Column('explanation', json_type, nullable=True, comment='讲解内容 JSON（由 Explainer Agent 生成）'),
+    sa.Column('feedback', sa.Text(), nullable=True, comment='Tutor 的反馈和引导'),
+    sa.ForeignKeyConstraint(['record_id'], ['learning_records.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('record_id'),
+    comment='学习记录内容表，存储回答、评估和讲解等大字段'
+    )
+    
+    # 迁移已有数据
+    op.execute(
+        'INSERT INTO learning_record_payloads '
+        '(record_id, answer, evaluation, explanation, feedback) '
+        'SELECT id, answer, evaluation, explanation, feedback '
+        'FROM learning_records'
+    )
+    
+    with op.batch_alter_table('learning_records', schema=None) as batch_op:
+        batch_op.drop_column('feedback')
+        batch_op.drop_column('explanation')
+        batch_op.drop_column('evaluation')
+        batch_op.drop_column('answer')
+    
+    if _dialect_name() != 'sqlite':
+        op.create_table_comment(
+            'learning_records',
+            '学习记录表，存储用户的作答统计',
+            existing_comment='学习记录表，存储用户的回答和评估结果',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    json_type = get_json_type()
+    
+    if _dialect_name() != 'sqlite':
+        op.create_table_comment(
+            'learning_records',
+            '学习记录表，存储用户的回答和评估结果',
+            existing_comment='学习记录表，存储用户的作答统计',
+        )
+    
+    with op.batch_alter_table('learning_records', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('answer', sa.Text(), nullable=True, comment='用户的回答内容'))
+        batch_op.add_column(sa.Column('evaluation', json_type, nullable=True, comment='评估结果 JSON，包含各要点的匹配情况'))
+        batch_op.add_column(sa.Column('explanation', json_type, nullable=True, comment='讲解内容 JSON（由 Explainer Agent 生成）'))
+        batch_op.add_column(sa.Column('feedback', sa.Text(), nullable=True, comment='Tutor 的反馈和引导'))
+    
+    for column in ('answer', 'evaluation', 'explanation', 'feedback'):
+        op.execute(
+            f'UPDATE learning_records SET {column} = ('
+            f'SELECT p.{column} FROM learning_record_payloads p '
+            f'WHERE p.record_id = learning_records.id)'
+        )
+    
+    op.drop_table('learning_record_payloads')
@@ -0,0 +1,48 @@
+"""active_rows_partial_indexes
+
+Revision ID: c8f14b3a6e02
+Revises: a5e83f1c9d27
+Create Date: 2026-10-15 23:20:51.330468
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f14b3a6e02'
+down_revision: Union[str, Sequence[str], None] = 'a5e83f1c9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (表名, 索引列)：仅覆盖未软删除行的部分索引
+ACTIVE_ROWS_INDEXES = [
+    ('projects', ['created_at']),
+    ('sessions', ['project_id']),
+    ('questions', ['project_id']),
+    ('analysis_documents', ['project_id']),
+    ('learning_records', ['session_id']),
+    ('notes', ['session_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in ACTIVE_ROWS_INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(
+                f'ix_{table}_active',
+                columns,
+                unique=False,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                sqlite_where=sa.text('deleted_at IS NULL'),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in reversed(ACTIVE_ROWS_INDEXES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_active')
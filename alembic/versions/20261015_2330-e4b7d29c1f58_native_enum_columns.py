@@ -0,0 +1,115 @@
+"""native_enum_columns
+
+Revision ID: e4b7d29c1f58
+Revises: c8f14b3a6e02
+Create Date: 2026-10-15 23:30:12.804117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7d29c1f58'
+down_revision: Union[str, Sequence[str], None] = 'c8f14b3a6e02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# PostgreSQL 枚举类型名 -> 枚举值（顺序即枚举比较/排序顺序）
+ENUM_TYPES = {
+    'project_status': [
+        'pending', 'cloning', 'analyzing', 'indexing', 'ready', 'failed',
+    ],
+    'session_status': ['active', 'paused', 'completed', 'abandoned'],
+    'learning_mode': ['macro', 'capability'],
+    'learning_stage': [
+        'overview', 'architecture', 'core_concepts', 'data_flow', 'extension',
+        'capability_intro', 'capability_impl', 'capability_practice',
+    ],
+    'question_difficulty': ['beginner', 'intermediate', 'advanced', 'expert'],
+    'analysis_section_type': [
+        'executive_summary', 'system_architecture', 'core_components',
+        'data_flow', 'key_algorithms', 'extension_points',
+        'dependency_analysis', 'best_practices', 'learning_roadmap',
+    ],
+}
+
+# (表名, 列名, 枚举类型名, 原字符串长度, 服务端默认值)
+ENUM_COLUMNS = [
+    ('projects', 'status', 'project_status', 20, 'pending'),
+    ('sessions', 'learning_mode', 'learning_mode', 20, 'macro'),
+    ('sessions', 'current_stage', 'learning_stage', 50, 'overview'),
+    ('sessions', 'status', 'session_status', 20, 'active'),
+    ('questions', 'stage', 'learning_stage', 50, 'overview'),
+    ('questions', 'difficulty', 'question_difficulty', 20, 'intermediate'),
+    ('analysis_documents', 'section_type', 'analysis_section_type', 50, None),
+]
+
+
+def _is_postgresql() -> bool:
+    """原生枚举类型仅适用于 PostgreSQL，其他数据库仍为 VARCHAR"""
+    from alembic import context
+    return context.get_context().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _is_postgresql():
+        for table, column, _, length, default in ENUM_COLUMNS:
+            if default is None:
+                continue
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.String(length=length),
+                    existing_nullable=False,
+                    server_default=default,
+                )
+        return
+    
+    for type_name, values in ENUM_TYPES.items():
+        labels = ', '.join(f"'{value}'" for value in values)
+        op.execute(f'CREATE TYPE {type_name} AS ENUM ({labels})')
+    
+    for table, column, type_name, length, default in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(length=length),
+            type_=sa.Enum(*ENUM_TYPES[type_name], name=type_name, create_type=False),
+            existing_nullable=False,
+            server_default=default,
+            postgresql_using=f'{column}::{type_name}',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_postgresql():
+        for table, column, _, length, default in reversed(ENUM_COLUMNS):
+            if default is None:
+                continue
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.String(length=length),
+                    existing_nullable=False,
+                    server_default=None,
+                )
+        return
+    
+    for table, column, type_name, length, default in reversed(ENUM_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Enum(*ENUM_TYPES[type_name], name=type_name, create_type=False),
+            type_=sa.String(length=length),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f'{column}::text',
+        )
+    
+    for type_name in reversed(list(ENUM_TYPES)):
+        op.execute(f'DROP TYPE {type_name}')
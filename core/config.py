@@ -181,6 +181,11 @@ class LLMSettings(BaseModel):
         default=3,
         description="最大重试次数"
     )
+    max_concurrent: int = Field(
+        default=16,
+        ge=1,
+        description="进程内 LLM 并发请求上限"
+    )
 
 
 class EmbeddingSettings(BaseModel):
@@ -201,6 +206,19 @@ class EmbeddingSettings(BaseModel):
         default=100,
         description="批量处理大小"
     )
+    max_batch_tokens: int = Field(
+        default=7500,
+        description="单批最大 token 数，批次按 token 数打包（同时受 batch_size 限制）"
+    )
+    num_workers: int = Field(
+        default=1,
+        ge=1,
+        description="HuggingFace 同步批量嵌入的工作进程数 (>1 时启用进程池)"
+    )
+    quantize: Literal["none", "int8"] = Field(
+        default="none",
+        description="HuggingFace 模型量化方式 (none/int8，int8 仅在 cpu 设备生效)"
+    )
 
 
 # =============================================================================
@@ -233,6 +251,14 @@ class VectorStoreSettings(BaseModel):
         default="default",
         description="默认集合名称"
     )
+    warmup_on_startup: bool = Field(
+        default=False,
+        description="应用启动时预热 Embedding 模型与向量库连接"
+    )
+    warmup_project_ids: list[str] = Field(
+        default_factory=list,
+        description="启动预热时需要预先创建检索器的项目 ID 列表"
+    )
 
 
 # =============================================================================
@@ -4,6 +4,7 @@
 """
 
 import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -17,6 +18,10 @@ from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 合法的本地目标目录名：单级目录，仅允许字母、数字和 . _ -
+_SAFE_NAME = re.compile(r"[A-Za-z0-9._-]{1,128}")
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
 
 @dataclass
 class RepoInfo:
@@ -320,18 +325,18 @@ class GitService:
         if name.endswith(".git"):
             name = name[:-4]
 
-        name = name.split("/")[-1]
+        name = _UNSAFE_NAME_CHARS.sub("_", name.split("/")[-1])[:128]
         return name or "repo"
 
     def _sanitize_target_name(self, target_name: str) -> str:
-        """清洗本地目标目录名，防止路径穿越。"""
-
-        name = target_name.strip().replace("\\", "/")
-        # 不允许绝对路径或包含 ..
-        if name.startswith("/"):
-            raise GitOperationError("Absolute paths are not allowed for target_name")
-        if any(part == ".." for part in Path(name).parts):
-            raise GitOperationError("target_name contains invalid path segment '..'")
+        """清洗本地目标目录名，防止路径穿越。
+
+        只接受单级目录名（不含路径分隔符），在执行任何 git 命令之前完成校验。
+        """
+
+        name = target_name.strip()
+        if not _SAFE_NAME.fullmatch(name) or name in (".", ".."):
+            raise GitOperationError(f"Invalid target_name: {target_name!r}")
         return name
 
     def _build_clone_url(self, repo_url: str, access_token: Optional[str]) -> str:
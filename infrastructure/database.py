@@ -1,12 +1,17 @@
 """
 数据库配置和连接管理
 """
+from contextlib import asynccontextmanager
+
+import orjson
+from sqlalchemy import JSON, event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.engine import make_url
-from typing import AsyncGenerator
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from typing import Any, AsyncGenerator, Optional
 
 from core.config import settings
-from infrastructure.models import Base
+from infrastructure.models import Base, SoftDeleteMixin, TimestampMixin, now_utc
 
 # 创建异步引擎
 def _build_async_url(database_url: str) -> str:
@@ -31,10 +36,21 @@ def _build_async_url(database_url: str) -> str:
     return str(url.set(drivername=async_driver))
 
 
+# JSON/JSONB 列序列化选项：允许非字符串键（与 json.dumps 行为一致）、直接序列化 numpy 值
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_serializer(value) -> str:
+    """使用 orjson 序列化 JSON/JSONB 列的值"""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+
+
 engine = create_async_engine(
     _build_async_url(settings.database.url),
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # 创建异步会话工厂 (SQLAlchemy 1.4 兼容)
@@ -44,6 +60,30 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    全局过滤已软删除的记录
+    
+    所有 ORM SELECT（包括关系加载）自动附加 deleted_at IS NULL 条件，
+    与各表的 ix_<table>_active 部分索引配合使用。
+    需要查询已删除记录时传入 execution_options(include_deleted=True)。
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """获取数据库会话（不自动提交，由调用方控制事务）
 
@@ -53,6 +93,28 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@asynccontextmanager
+async def bulk_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    获取用于批量写入的数据库会话（退出时自动提交，异常时回滚）
+    
+    关闭 autoflush，批量路径中的查询不会触发对已 add 对象的 flush，
+    避免 unit-of-work 反复构建待写入对象图；配合 bulk_create 走 Core insert，
+    不创建 ORM 实例和身份映射。
+    
+    用法：
+        async with bulk_session() as session:
+            await bulk_create(session, QuestionModel, rows)
+    """
+    async with AsyncSessionLocal(autoflush=False) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 async def create_tables():
     """
     创建所有表
@@ -71,3 +133,121 @@ async def drop_tables():
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+async def bulk_create(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    batch_size: int = 500,
+) -> list[Optional[str]]:
+    """
+    批量插入多行记录（不经过 ORM 实例构造和 unit-of-work）
+    
+    适用于一次生成大量记录的场景（如为项目批量生成问题、导入学习记录）。
+    缺少 id 的行通过 model.generate_ids 一次性预分配主键，时间戳整批共用
+    同一个值；随后按 batch_size 分块执行 insert(model)，由 SQLAlchemy 折叠为
+    多行 VALUES 语句。不在调用方传入的 rows 上原地修改。
+    
+    Args:
+        session: 数据库会话（事务由调用方控制）
+        model: 目标模型类
+        rows: 列名 -> 值 的字典列表，各行应包含相同的键
+        batch_size: 每条 INSERT 语句包含的最大行数
+    
+    Returns:
+        插入记录的 ID 列表（与 rows 顺序一致；自增主键模型为 None）
+    """
+    if not rows:
+        return []
+    
+    prepared = _prepare_bulk_rows(model, rows)
+    
+    statement = insert(model)
+    for start in range(0, len(prepared), batch_size):
+        await session.execute(statement, prepared[start:start + batch_size])
+    
+    return [row.get("id") for row in prepared]
+
+
+async def bulk_copy(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+) -> list[Optional[str]]:
+    """
+    通过 PostgreSQL COPY 批量导入记录（用于学习记录、笔记等大批量历史数据回放）
+    
+    COPY FROM STDIN（asyncpg 二进制格式）跳过逐行 SQL 解析，比多行 VALUES 的
+    INSERT 更快。主键和时间戳的预填充与 bulk_create 相同；COPY 不会执行模型上的
+    Python 端默认值，rows 中未出现的列取数据库默认值，因此各行应包含相同的键，
+    且非空列需显式给出。非 PostgreSQL 数据库回退到 bulk_create。
+    
+    Args:
+        session: 数据库会话（事务由调用方控制）
+        model: 目标模型类
+        rows: 列名 -> 值 的字典列表，各行应包含相同的键
+    
+    Returns:
+        插入记录的 ID 列表（与 rows 顺序一致；自增主键模型为 None）
+    """
+    if not rows:
+        return []
+    
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return await bulk_create(session, model, rows)
+    
+    prepared = _prepare_bulk_rows(model, rows)
+    
+    table = model.__table__
+    columns = list(prepared[0])
+    # JSON/JSONB 列按引擎的序列化方式预先编码，其余值交给 asyncpg 按列类型编码
+    json_columns = {name for name in columns if isinstance(table.c[name].type, JSON)}
+    records = [
+        tuple(
+            _json_serializer(row[name])
+            if name in json_columns and row[name] is not None
+            else row[name]
+            for name in columns
+        )
+        for row in prepared
+    ]
+    
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if not driver_connection.is_in_transaction():
+        # asyncpg 适配器在首条语句执行时才 BEGIN；COPY 直接走驱动连接，
+        # 需先执行一条语句开启事务，否则会以自动提交方式写入，调用方无法回滚
+        await connection.exec_driver_sql("SELECT 1")
+    await driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=columns,
+        schema_name=table.schema,
+    )
+    
+    return [row.get("id") for row in prepared]
+
+
+def _prepare_bulk_rows(model: type[Base], rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """复制 rows 并预填充缺失的主键和时间戳（整批共用同一时间）"""
+    prepared = [dict(row) for row in rows]
+    
+    generate_ids = getattr(model, "generate_ids", None)
+    if generate_ids is not None:
+        missing = [row for row in prepared if not row.get("id")]
+        for row, new_id in zip(missing, generate_ids(len(missing))):
+            row["id"] = new_id
+    
+    # 时间戳和软删除列只在带对应 Mixin 的模型上填充（如 1:1 内容表直接继承 Base）
+    if issubclass(model, TimestampMixin):
+        now = now_utc()
+        for row in prepared:
+            row.setdefault("created_at", now)
+            row.setdefault("updated_at", now)
+    if issubclass(model, SoftDeleteMixin):
+        for row in prepared:
+            row.setdefault("deleted_at", None)
+    
+    return prepared
@@ -39,6 +39,8 @@ LangChain 封装层
 from .llm import (
     get_llm,
     get_cached_llm,
+    close_llm_http_clients,
+    PooledLLM,
     LLMProvider,
 )
 
@@ -46,6 +48,7 @@ from .llm import (
 from .embeddings import (
     get_embeddings,
     get_cached_embeddings,
+    shutdown_embedding_process_pools,
     EmbeddingProvider,
 )
 
@@ -53,6 +56,7 @@ from .embeddings import (
 from .vectorstore import (
     get_vectorstore,
     create_collection_if_not_exists,
+    warmup_vectorstores,
     VectorStoreProvider,
 )
 
@@ -90,14 +94,18 @@ __all__ = [
     # LLM
     "get_llm",
     "get_cached_llm",
+    "close_llm_http_clients",
+    "PooledLLM",
     "LLMProvider",
     # Embedding
     "get_embeddings",
     "get_cached_embeddings",
+    "shutdown_embedding_process_pools",
     "EmbeddingProvider",
     # VectorStore
     "get_vectorstore",
     "create_collection_if_not_exists",
+    "warmup_vectorstores",
     "VectorStoreProvider",
     # Retriever
     "get_code_retriever",
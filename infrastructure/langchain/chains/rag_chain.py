@@ -10,16 +10,35 @@ RAG 检索链 - 代码问答
 - create_analysis_chain: 分析文档生成 Chain
 """
 
-from typing import Optional, Any, AsyncIterator, Iterator, Dict, List, Callable, Union
-from functools import partial
+import asyncio
+from typing import Optional, Any, AsyncIterator, Iterator, Dict, List, Callable, Union, Tuple
+from functools import partial, lru_cache
+from types import MappingProxyType
 
 from core.logging_config import get_logger
 from ..llm import get_llm
 from ..retrievers import get_code_retriever
 from ..prompts.code_explain import CODE_EXPLAIN_SYSTEM, CODE_EXPLAIN_PROMPT
+from ..prompts.analysis import (
+    ARCHITECTURE_ANALYSIS_SYSTEM,
+    ARCHITECTURE_ANALYSIS_PROMPT,
+    MODULE_ANALYSIS_PROMPT,
+    CORE_CLASS_ANALYSIS_PROMPT,
+    KEY_METHOD_ANALYSIS_PROMPT,
+    CORE_FLOW_ANALYSIS_PROMPT,
+)
 
 logger = get_logger(__name__)
 
+# 分析类型 -> Prompt（只读，模块加载时构建一次）
+_ANALYSIS_PROMPTS = MappingProxyType({
+    "architecture": ARCHITECTURE_ANALYSIS_PROMPT,
+    "module": MODULE_ANALYSIS_PROMPT,
+    "class": CORE_CLASS_ANALYSIS_PROMPT,
+    "method": KEY_METHOD_ANALYSIS_PROMPT,
+    "flow": CORE_FLOW_ANALYSIS_PROMPT,
+})
+
 
 # ============================================================================
 # 文档格式化函数
@@ -305,14 +324,61 @@ async def answer_code_question(
         # 流式
         >>> async for chunk in await answer_code_question("proj_123", "入口在哪里？", streaming=True):
         ...     print(chunk, end="")
-    """
-    chain = create_code_qa_chain(project_id, search_k=search_k)
     
+    Note:
+        非流式模式下，相同 (project_id, question, search_k) 的并发请求会合并为
+        一次检索 + 一次 LLM 调用，所有调用方共享同一结果。流式模式每个调用方
+        需要独立的迭代器，不做合并。
+    """
     if streaming:
+        chain = create_code_qa_chain(project_id, search_k=search_k)
         return stream_rag_response(chain, question)
     
-    response = await chain.ainvoke(question)
-    return response
+    key = (project_id, question, search_k)
+    task = _inflight_answers.get(key)
+    
+    if task is None:
+        task = asyncio.ensure_future(_answer_code_question(project_id, question, search_k))
+        _inflight_answers[key] = task
+        task.add_done_callback(partial(_discard_inflight_answer, key))
+    else:
+        logger.debug("answer_request_coalesced", project_id=project_id, question=question[:50])
+    
+    # shield: 单个调用方被取消时不影响其他等待同一结果的调用方
+    return await asyncio.shield(task)
+
+
+# 进行中的非流式问答请求 (project_id, question, search_k) -> Task
+_inflight_answers: Dict[Tuple[str, str, int], "asyncio.Task[str]"] = {}
+
+
+async def _answer_code_question(project_id: str, question: str, search_k: int) -> str:
+    """执行一次代码问答（检索 + LLM 生成）"""
+    chain = create_code_qa_chain(project_id, search_k=search_k)
+    return await chain.ainvoke(question)
+
+
+def _discard_inflight_answer(key: Tuple[str, str, int], task: "asyncio.Task[str]") -> None:
+    """
+    请求完成后移除进行中的记录
+    
+    调用方都通过 shield 等待，全部被取消后任务仍会执行完毕；此处读取任务异常并
+    记录日志，避免无人获取时由 asyncio 报告 "Task exception was never retrieved"。
+    """
+    if _inflight_answers.get(key) is task:
+        del _inflight_answers[key]
+    
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning(
+            "answer_code_question_failed",
+            project_id=key[0],
+            question=key[1][:50],
+            error=str(exc),
+            error_type=type(exc).__name__,
+        )
 
 
 async def answer_code_question_with_sources(
@@ -357,6 +423,8 @@ def create_analysis_chain(
     """
     创建分析文档生成 Chain
     
+    未指定 llm 时，按分析类型复用已构建的 Chain，避免每次请求重复构建。
+    
     Args:
         retriever: 代码检索器
         analysis_type: 分析类型 (architecture, module, class, method, flow)
@@ -365,40 +433,36 @@ def create_analysis_chain(
     Returns:
         Runnable: 分析 Chain
     """
+    # 未知类型回退为 architecture，避免缓存被任意 key 填充
+    if analysis_type not in _ANALYSIS_PROMPTS:
+        analysis_type = "architecture"
+    
+    if llm is None:
+        return _get_default_analysis_chain(analysis_type)
+    
+    return _build_analysis_chain(analysis_type, llm)
+
+
+@lru_cache(maxsize=8)
+def _get_default_analysis_chain(analysis_type: str):
+    """获取使用默认 LLM 的分析 Chain（按分析类型缓存）"""
+    llm = get_llm(temperature=0.3)  # 分析任务使用较低温度
+    return _build_analysis_chain(analysis_type, llm)
+
+
+def _build_analysis_chain(analysis_type: str, llm: Any):
+    """构建分析 Chain"""
     try:
         from langchain_core.prompts import ChatPromptTemplate
-        from langchain_core.runnables import RunnablePassthrough
         from langchain_core.output_parsers import StrOutputParser
     except ImportError:
         raise ImportError(
             "langchain-core is required. Install with: pip install langchain-core"
         )
     
-    from ..prompts.analysis import (
-        ARCHITECTURE_ANALYSIS_SYSTEM,
-        ARCHITECTURE_ANALYSIS_PROMPT,
-        MODULE_ANALYSIS_PROMPT,
-        CORE_CLASS_ANALYSIS_PROMPT,
-        KEY_METHOD_ANALYSIS_PROMPT,
-        CORE_FLOW_ANALYSIS_PROMPT,
-    )
-    
-    # 根据分析类型选择 Prompt
-    prompt_map = {
-        "architecture": ARCHITECTURE_ANALYSIS_PROMPT,
-        "module": MODULE_ANALYSIS_PROMPT,
-        "class": CORE_CLASS_ANALYSIS_PROMPT,
-        "method": KEY_METHOD_ANALYSIS_PROMPT,
-        "flow": CORE_FLOW_ANALYSIS_PROMPT,
-    }
-    
-    human_prompt = prompt_map.get(analysis_type, ARCHITECTURE_ANALYSIS_PROMPT)
-    
-    llm = llm or get_llm(temperature=0.3)  # 分析任务使用较低温度
-    
     prompt = ChatPromptTemplate.from_messages([
         ("system", ARCHITECTURE_ANALYSIS_SYSTEM),
-        ("human", human_prompt),
+        ("human", _ANALYSIS_PROMPTS[analysis_type]),
     ])
     
     # 分析 Chain - 接受结构化输入
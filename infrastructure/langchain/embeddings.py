@@ -12,7 +12,10 @@ Embedding 配置模块 - 通过 LangChain 统一封装
     >>> vectors = await embeddings.aembed_documents(["Hello", "World"])
 """
 
-from typing import Optional, Literal, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, Literal, List, Tuple
 
 from langchain_core.embeddings import Embeddings
 
@@ -115,12 +118,60 @@ def _get_huggingface_embeddings(model: str) -> Embeddings:
         device=settings.embedding.device,
     )
     
-    return HuggingFaceEmbeddings(
+    embeddings = HuggingFaceEmbeddings(
         model_name=model,
         model_kwargs={"device": settings.embedding.device},
         encode_kwargs={"normalize_embeddings": True},
     )
 
+    if settings.embedding.quantize == "int8":
+        _quantize_huggingface_model_int8(embeddings, model)
+
+    return embeddings
+
+
+def _quantize_huggingface_model_int8(embeddings: Embeddings, model: str) -> None:
+    """
+    将 HuggingFace 模型的 Linear 层动态量化为 int8（原地替换）
+
+    权重以 int8 存储、激活在推理时动态量化，内存带宽约降为 1/4，
+    并可利用 CPU 的 int8 指令（VNNI）提升吞吐。输出向量仍为 float，
+    与向量库存储格式兼容，仅有轻微召回损失。
+
+    动态量化仅支持 CPU，其他设备下跳过并保持原精度。
+    """
+    device = settings.embedding.device
+    if device != "cpu":
+        logger.warning(
+            "huggingface_quantize_skipped",
+            model=model,
+            device=device,
+            reason="int8 dynamic quantization is only supported on cpu",
+        )
+        return
+
+    try:
+        import torch
+    except ImportError:
+        raise EmbeddingProviderError(
+            "torch is required for int8 quantization. "
+            "Install with: pip install torch"
+        )
+
+    # 新版本 langchain-huggingface 使用私有属性 _client
+    client = getattr(embeddings, "_client", None) or getattr(embeddings, "client", None)
+    if client is None:
+        logger.warning("huggingface_quantize_skipped", model=model, reason="client not found")
+        return
+
+    torch.quantization.quantize_dynamic(
+        client,
+        {torch.nn.Linear},
+        dtype=torch.qint8,
+        inplace=True,
+    )
+    logger.debug("huggingface_embeddings_quantized", model=model, dtype="int8")
+
 
 # =============================================================================
 # 缓存 Embeddings 实例
@@ -177,11 +228,13 @@ async def embed_documents_batch(
     """
     批量嵌入文档
     
-    将大量文本分批处理，避免单次请求过大。
+    将大量文本分批处理，避免单次请求过大。批次按 token 数贪心打包：
+    累计 token 数达到 EMBEDDING__MAX_BATCH_TOKENS 或文本数达到 batch_size
+    时切分，使每次请求尽量装满，减少往返次数。
     
     Args:
         texts: 要嵌入的文本列表
-        batch_size: 每批大小，默认从配置读取
+        batch_size: 每批最多文本数，默认从配置读取
         provider: Embedding 提供商
         model: 模型名称
     
@@ -193,15 +246,20 @@ async def embed_documents_batch(
         >>> vectors = await embed_documents_batch(texts, batch_size=50)
     """
     batch_size = batch_size or settings.embedding.batch_size
+    provider = provider or settings.embedding.provider
+    model = model or settings.embedding.model
     embeddings = get_cached_embeddings(provider=provider, model=model)
     
+    token_counts = _count_tokens(texts, provider, model)
+    
     all_vectors: List[List[float]] = []
     
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i + batch_size]
+    for batch_index, batch in enumerate(
+        _pack_batches(texts, token_counts, batch_size, settings.embedding.max_batch_tokens)
+    ):
         logger.debug(
             "embedding_batch",
-            batch_index=i // batch_size,
+            batch_index=batch_index,
             batch_size=len(batch),
             total=len(texts),
         )
@@ -213,11 +271,83 @@ async def embed_documents_batch(
     return all_vectors
 
 
+def _pack_batches(
+    texts: List[str],
+    token_counts: Optional[List[int]],
+    batch_size: int,
+    max_batch_tokens: int,
+) -> Iterator[List[str]]:
+    """
+    按原顺序将文本贪心打包为批次
+    
+    token_counts 为 None（无法分词）时退化为按 batch_size 切分。
+    单条文本超过 max_batch_tokens 时独占一个批次。
+    """
+    if token_counts is None:
+        for i in range(0, len(texts), batch_size):
+            yield texts[i:i + batch_size]
+        return
+    
+    batch: List[str] = []
+    batch_tokens = 0
+    
+    for text, count in zip(texts, token_counts):
+        if batch and (batch_tokens + count > max_batch_tokens or len(batch) >= batch_size):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += count
+    
+    if batch:
+        yield batch
+
+
+def _count_tokens(texts: List[str], provider: str, model: str) -> Optional[List[int]]:
+    """一次性计算所有文本的 token 数，无可用分词器时返回 None"""
+    counter = _get_token_counter(provider, model)
+    if counter is None:
+        return None
+    return [counter(text) for text in texts]
+
+
+@lru_cache(maxsize=8)
+def _get_token_counter(provider: str, model: str) -> Optional[Callable[[str], int]]:
+    """
+    获取 token 计数函数
+    
+    - OpenAI: tiktoken 编码器
+    - HuggingFace: 模型自带的 tokenizer
+    """
+    try:
+        if provider == "openai":
+            import tiktoken
+            
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        
+        if provider == "huggingface":
+            embeddings = get_cached_embeddings(provider=provider, model=model)
+            client = getattr(embeddings, "_client", None) or getattr(embeddings, "client", None)
+            tokenizer = getattr(client, "tokenizer", None)
+            if tokenizer is not None:
+                return lambda text: len(tokenizer.encode(text, add_special_tokens=True))
+    except Exception as e:
+        # 分词器不可用（未安装或无法下载词表）时退化为按文本数分批
+        logger.warning("token_counter_unavailable", provider=provider, model=model, error=str(e))
+    
+    return None
+
+
 def embed_documents_batch_sync(
     texts: List[str],
     batch_size: Optional[int] = None,
     provider: Optional[str] = None,
     model: Optional[str] = None,
+    parallel: bool = False,
 ) -> List[List[float]]:
     """
     批量嵌入文档（同步版本）
@@ -227,11 +357,24 @@ def embed_documents_batch_sync(
         batch_size: 每批大小
         provider: Embedding 提供商
         model: 模型名称
+        parallel: 是否使用进程池并行嵌入（仅 HuggingFace 且
+            EMBEDDING__NUM_WORKERS > 1 时生效）
     
     Returns:
         List[List[float]]: 嵌入向量列表
+    
+    Note:
+        HuggingFace 在 CPU 上推理时，分词、padding 等 Python 侧处理会持有 GIL，
+        多线程无法利用多核。并行模式下每个工作进程加载一份模型，按批次分发后
+        按原顺序合并结果。OpenAI 为 I/O 密集型，应使用异步版本 embed_documents_batch。
     """
     batch_size = batch_size or settings.embedding.batch_size
+    provider = provider or settings.embedding.provider
+    model = model or settings.embedding.model
+    
+    if parallel and provider == "huggingface" and settings.embedding.num_workers > 1:
+        return _embed_documents_in_process_pool(texts, batch_size, provider, model)
+    
     embeddings = get_cached_embeddings(provider=provider, model=model)
     
     all_vectors: List[List[float]] = []
@@ -249,3 +392,79 @@ def embed_documents_batch_sync(
         all_vectors.extend(batch_vectors)
     
     return all_vectors
+
+
+# =============================================================================
+# 进程池嵌入（HuggingFace）
+# =============================================================================
+
+_process_pools: dict[Tuple[str, str], ProcessPoolExecutor] = {}
+
+# 工作进程内的模型实例，由 _init_embedding_worker 在进程启动时加载一次
+_worker_embeddings: Optional[Embeddings] = None
+
+
+def _init_embedding_worker(provider: str, model: str) -> None:
+    """工作进程初始化：加载 Embedding 模型"""
+    global _worker_embeddings
+    _worker_embeddings = get_embeddings(provider=provider, model=model)
+
+
+def _embed_batch_in_worker(batch: List[str]) -> List[List[float]]:
+    """在工作进程中嵌入一个批次"""
+    return _worker_embeddings.embed_documents(batch)
+
+
+def _get_process_pool(provider: str, model: str) -> ProcessPoolExecutor:
+    """获取（或延迟创建）指定模型的进程池"""
+    key = (provider, model)
+    pool = _process_pools.get(key)
+    
+    if pool is None:
+        # spawn: 避免 fork 继承 torch 线程池状态导致死锁
+        pool = ProcessPoolExecutor(
+            max_workers=settings.embedding.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_embedding_worker,
+            initargs=(provider, model),
+        )
+        _process_pools[key] = pool
+        logger.debug(
+            "embedding_process_pool_created",
+            provider=provider,
+            model=model,
+            num_workers=settings.embedding.num_workers,
+        )
+    
+    return pool
+
+
+def _embed_documents_in_process_pool(
+    texts: List[str],
+    batch_size: int,
+    provider: str,
+    model: str,
+) -> List[List[float]]:
+    """使用进程池并行嵌入，结果保持输入顺序"""
+    pool = _get_process_pool(provider, model)
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    
+    logger.debug(
+        "embedding_batches_parallel",
+        batch_count=len(batches),
+        total=len(texts),
+    )
+    
+    all_vectors: List[List[float]] = []
+    for batch_vectors in pool.map(_embed_batch_in_worker, batches):
+        all_vectors.extend(batch_vectors)
+    
+    return all_vectors
+
+
+def shutdown_embedding_process_pools() -> None:
+    """关闭所有 Embedding 进程池"""
+    for pool in _process_pools.values():
+        pool.shutdown(wait=True)
+    _process_pools.clear()
+    logger.debug("embedding_process_pools_shutdown")
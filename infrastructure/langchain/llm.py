@@ -13,10 +13,30 @@ LLM 配置模块 - 通过 LangChain 统一封装
     >>> response = await llm.ainvoke("Hello!")
 """
 
-from typing import Optional, Literal, Union
+import asyncio
+import atexit
+import importlib
+import threading
+import weakref
+from typing import Any, AsyncIterator, Iterator, List, Optional, Literal, Union, Tuple
 from functools import lru_cache
 
+import httpx
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from core.config import settings
 from core.logging_config import get_logger
@@ -27,6 +47,80 @@ logger = get_logger(__name__)
 # LLM 提供商类型
 LLMProvider = Literal["openai", "anthropic", "ollama"]
 
+# 共享 HTTP 连接池参数：跨 ChatModel 实例复用 TCP/TLS 连接
+_HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    按事件循环各自维护连接池的异步传输层
+    
+    httpx 连接池中的连接和锁绑定首次使用它们的事件循环；Celery 任务中每次
+    asyncio.run 都会新建循环，复用上一个循环的连接会报 "Event loop is closed"。
+    共享的 AsyncClient 把请求转发给当前循环专属的 AsyncClient（与
+    _async_semaphores 相同，按循环弱引用保存，循环回收后随之释放）。
+    """
+    
+    def __init__(self) -> None:
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=_HTTP_POOL_LIMITS,
+                timeout=httpx.Timeout(settings.llm.timeout),
+            )
+            self._clients[loop] = client
+        return client
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_client().send(request, stream=True)
+    
+    async def aclose(self) -> None:
+        """关闭当前事件循环的连接池"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_async_transport = _LoopLocalTransport()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    获取进程内共享的 httpx 同步/异步客户端
+    
+    每次创建 ChatModel 时若不传入 http_client，SDK 会各自建立连接池，
+    新实例的首个请求需要重新进行 TCP + TLS 握手。共享客户端后，
+    所有实例复用同一组 keep-alive 连接；异步客户端的连接池按事件循环隔离。
+    """
+    timeout = httpx.Timeout(settings.llm.timeout)
+    sync_client = httpx.Client(limits=_HTTP_POOL_LIMITS, timeout=timeout)
+    async_client = httpx.AsyncClient(transport=_async_transport, timeout=timeout)
+    atexit.register(sync_client.close)
+    
+    logger.debug("shared_http_clients_created", timeout=settings.llm.timeout)
+    return sync_client, async_client
+
+
+async def close_llm_http_clients() -> None:
+    """
+    关闭当前事件循环中共享的 LLM 异步连接池（应用关闭时调用）
+    
+    共享的 AsyncClient 本身保持可用，之后在新的事件循环中发起的请求会重新建立连接池。
+    """
+    await _async_transport.aclose()
+    logger.debug("llm_http_clients_closed")
+
 
 def get_llm(
     provider: Optional[LLMProvider] = None,
@@ -50,7 +144,7 @@ def get_llm(
         max_retries: 最大重试次数
     
     Returns:
-        BaseChatModel: LangChain ChatModel 实例
+        BaseChatModel: 包装了 Provider ChatModel 的 PooledLLM 实例
     
     Raises:
         LLMProviderError: 不支持的 provider
@@ -77,36 +171,52 @@ def get_llm(
         timeout=timeout,
     )
     
-    if provider == "openai":
-        return _get_openai_llm(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            streaming=streaming,
-            timeout=timeout,
-            max_retries=max_retries,
-        )
-    elif provider == "anthropic":
-        return _get_anthropic_llm(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            streaming=streaming,
-            timeout=timeout,
-            max_retries=max_retries,
-        )
-    elif provider == "ollama":
-        return _get_ollama_llm(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            streaming=streaming,
-        )
-    else:
+    factory = _PROVIDER_FACTORIES.get(provider)
+    if factory is None:
         raise LLMProviderError(
             f"Unsupported LLM provider: {provider}. "
-            f"Supported providers: openai, anthropic, ollama"
+            f"Supported providers: {', '.join(_PROVIDER_FACTORIES)}"
         )
+    
+    # 重试统一由 PooledLLM 负责，底层 SDK 不再重复重试
+    inner = factory(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        streaming=streaming,
+        timeout=timeout,
+        max_retries=0,
+    )
+    return PooledLLM(inner=inner, max_retries=max_retries)
+
+
+@lru_cache(maxsize=None)
+def _load_chat_model_class(module_name: str, class_name: str) -> type:
+    """
+    延迟导入 Provider SDK 的 ChatModel 类
+    
+    首次调用时才导入对应的 langchain 集成包，之后直接返回缓存的类对象。
+    导入失败时抛出 ImportError（不会被缓存，安装依赖后可重试）。
+    """
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def _unwrap_secret(value) -> Optional[str]:
+    """将 SecretStr 解包为明文字符串"""
+    return value.get_secret_value() if hasattr(value, 'get_secret_value') else value
+
+
+@lru_cache(maxsize=1)
+def _get_openai_api_key() -> Optional[str]:
+    """解析 OpenAI API Key（进程内只解析一次）"""
+    return _unwrap_secret(settings.openai.api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_anthropic_api_key() -> Optional[str]:
+    """解析 Anthropic API Key（进程内只解析一次）"""
+    return _unwrap_secret(settings.anthropic.api_key)
 
 
 def _get_openai_llm(
@@ -119,7 +229,7 @@ def _get_openai_llm(
 ) -> BaseChatModel:
     """获取 OpenAI ChatModel"""
     try:
-        from langchain_openai import ChatOpenAI
+        ChatOpenAI = _load_chat_model_class("langchain_openai", "ChatOpenAI")
     except ImportError:
         raise LLMProviderError(
             "langchain-openai is required for OpenAI provider. "
@@ -127,7 +237,7 @@ def _get_openai_llm(
         )
     
     # 验证 API Key
-    api_key = settings.openai.api_key
+    api_key = _get_openai_api_key()
     if not api_key:
         raise LLMConfigError(
             "OpenAI API key is not configured. "
@@ -137,7 +247,7 @@ def _get_openai_llm(
     kwargs = {
         "model": model,
         "temperature": temperature,
-        "api_key": api_key.get_secret_value() if hasattr(api_key, 'get_secret_value') else api_key,
+        "api_key": api_key,
         "streaming": streaming,
         "timeout": timeout,
         "max_retries": max_retries,
@@ -149,6 +259,8 @@ def _get_openai_llm(
     if max_tokens:
         kwargs["max_tokens"] = max_tokens
     
+    kwargs["http_client"], kwargs["http_async_client"] = _get_shared_http_clients()
+    
     logger.debug("openai_llm_created", model=model)
     return ChatOpenAI(**kwargs)
 
@@ -163,7 +275,7 @@ def _get_anthropic_llm(
 ) -> BaseChatModel:
     """获取 Anthropic ChatModel"""
     try:
-        from langchain_anthropic import ChatAnthropic
+        ChatAnthropic = _load_chat_model_class("langchain_anthropic", "ChatAnthropic")
     except ImportError:
         raise LLMProviderError(
             "langchain-anthropic is required for Anthropic provider. "
@@ -171,7 +283,7 @@ def _get_anthropic_llm(
         )
     
     # 验证 API Key
-    api_key = settings.anthropic.api_key
+    api_key = _get_anthropic_api_key()
     if not api_key:
         raise LLMConfigError(
             "Anthropic API key is not configured. "
@@ -181,7 +293,7 @@ def _get_anthropic_llm(
     kwargs = {
         "model": model,
         "temperature": temperature,
-        "api_key": api_key.get_secret_value() if hasattr(api_key, 'get_secret_value') else api_key,
+        "api_key": api_key,
         "streaming": streaming,
         "timeout": timeout,
         "max_retries": max_retries,
@@ -199,10 +311,12 @@ def _get_ollama_llm(
     temperature: float,
     max_tokens: Optional[int],
     streaming: bool,
+    timeout: int,
+    max_retries: int,
 ) -> BaseChatModel:
-    """获取 Ollama ChatModel (本地模型)"""
+    """获取 Ollama ChatModel (本地模型)，timeout/max_retries 不适用于本地服务"""
     try:
-        from langchain_ollama import ChatOllama
+        ChatOllama = _load_chat_model_class("langchain_ollama", "ChatOllama")
     except ImportError:
         raise LLMProviderError(
             "langchain-ollama is required for Ollama provider. "
@@ -222,13 +336,161 @@ def _get_ollama_llm(
     return ChatOllama(**kwargs)
 
 
+# Provider -> 工厂函数（模块加载时构建的分发表）
+_PROVIDER_FACTORIES = {
+    "openai": _get_openai_llm,
+    "anthropic": _get_anthropic_llm,
+    "ollama": _get_ollama_llm,
+}
+
+
 # =============================================================================
-# 缓存 LLM 实例
+# 统一调用入口：并发限制 + 重试
 # =============================================================================
 
-_llm_cache: dict[str, BaseChatModel] = {}
+# 可重试的 HTTP 状态码（限流、超时、服务端错误）
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Provider SDK 中表示连接/超时失败的异常类名（openai 与 anthropic 命名一致）
+_RETRYABLE_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+# 同步调用共享的并发上限
+_sync_semaphore = threading.BoundedSemaphore(settings.llm.max_concurrent)
+
+# asyncio.Semaphore 绑定事件循环，按循环各自维护一个
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_semaphore() -> asyncio.Semaphore:
+    """获取当前事件循环的 LLM 并发信号量"""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.llm.max_concurrent)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    判断异常是否为可重试的瞬时错误（超时、连接失败、限流和 5xx）
+    
+    PooledLLM 和代码检索（retrievers）共用同一重试判定。
+    """
+    if isinstance(exc, (httpx.TransportError, TimeoutError, ConnectionError)):
+        return True
+    if type(exc).__name__ in _RETRYABLE_ERROR_NAMES:
+        return True
+    return getattr(exc, "status_code", None) in _RETRYABLE_STATUS_CODES
+
+
+def _log_retry(retry_state) -> None:
+    """重试前记录日志"""
+    logger.warning(
+        "llm_call_retry",
+        attempt=retry_state.attempt_number,
+        error=str(retry_state.outcome.exception()),
+    )
 
 
+class PooledLLM(BaseChatModel):
+    """
+    所有 LLM 调用的统一入口
+    
+    包装 Provider 的 ChatModel，在一处提供：
+    - 进程内并发上限（settings.llm.max_concurrent）
+    - 基于 tenacity 的指数退避重试（仅重试瞬时错误）
+    
+    流式输出只受并发限制，不做重试（已产出的 token 无法撤回）。
+    """
+    
+    inner: BaseChatModel
+    max_retries: int = 0
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    @property
+    def _llm_type(self) -> str:
+        return f"pooled-{self.inner._llm_type}"
+    
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return self.inner._identifying_params
+    
+    def _retry_options(self) -> dict[str, Any]:
+        return {
+            "stop": stop_after_attempt(self.max_retries + 1),
+            "wait": wait_exponential(multiplier=0.2),
+            "retry": retry_if_exception(is_retryable_error),
+            "before_sleep": _log_retry,
+            "reraise": True,
+        }
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        with _sync_semaphore:
+            for attempt in Retrying(**self._retry_options()):
+                with attempt:
+                    return self.inner._generate(
+                        messages, stop=stop, run_manager=run_manager, **kwargs
+                    )
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        async with _get_async_semaphore():
+            async for attempt in AsyncRetrying(**self._retry_options()):
+                with attempt:
+                    return await self.inner._agenerate(
+                        messages, stop=stop, run_manager=run_manager, **kwargs
+                    )
+    
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        with _sync_semaphore:
+            yield from self.inner._stream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+    
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async with _get_async_semaphore():
+            async for chunk in self.inner._astream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            ):
+                yield chunk
+    
+    def bind_tools(self, tools, **kwargs: Any):
+        """由底层模型转换工具定义，调用仍经过 PooledLLM"""
+        bound = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**bound.kwargs)
+
+
+# =============================================================================
+# 缓存 LLM 实例
+# =============================================================================
+
 def get_cached_llm(
     provider: Optional[str] = None,
     model: Optional[str] = None,
@@ -247,26 +509,37 @@ def get_cached_llm(
     
     Returns:
         BaseChatModel: 缓存的 LLM 实例
+    
+    Note:
+        线程安全：lru_cache 本身不会合并并发未命中，多个线程同时未命中时
+        会各自创建实例并返回不同对象。这里用锁串行化调用，保证同一个 key
+        在进程内只创建一个实例（同一事件循环内的调用不会发生竞争）。
     """
     provider = provider or settings.llm.provider
     model = model or settings.llm.model
     temperature = temperature if temperature is not None else settings.llm.temperature
     
-    cache_key = f"{provider}:{model}:{temperature}"
-    
-    if cache_key not in _llm_cache:
-        _llm_cache[cache_key] = get_llm(
-            provider=provider,
-            model=model,
-            temperature=temperature,
-            streaming=False,
-        )
-        logger.debug("llm_cached", cache_key=cache_key)
-    
-    return _llm_cache[cache_key]
+    with _llm_cache_lock:
+        return _get_cached_llm(provider, model, float(temperature))
+
+
+_llm_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _get_cached_llm(provider: str, model: str, temperature: float) -> BaseChatModel:
+    """按 (provider, model, temperature) 缓存 LLM 实例，超出容量时按 LRU 淘汰"""
+    llm = get_llm(
+        provider=provider,
+        model=model,
+        temperature=temperature,
+        streaming=False,
+    )
+    logger.debug("llm_cached", provider=provider, model=model, temperature=temperature)
+    return llm
 
 
 def clear_llm_cache():
     """清除 LLM 缓存"""
-    _llm_cache.clear()
+    _get_cached_llm.cache_clear()
     logger.debug("llm_cache_cleared")
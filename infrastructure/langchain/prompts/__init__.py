@@ -11,7 +11,7 @@ Prompt 模版模块
 """
 
 from .code_explain import CODE_EXPLAIN_PROMPT, CODE_EXPLAIN_SYSTEM
-from .question_generate import QUESTION_GENERATE_PROMPT
+from .question_generate import QUESTION_GENERATE_PROMPT, QUESTION_GENERATE_PROMPT_TEMPLATE
 from .tutor import TUTOR_SYSTEM_PROMPT, TUTOR_FEEDBACK_PROMPT
 from .analysis import (
     ARCHITECTURE_ANALYSIS_SYSTEM,
@@ -31,6 +31,7 @@ __all__ = [
     "CODE_EXPLAIN_SYSTEM",
     # 问题生成
     "QUESTION_GENERATE_PROMPT",
+    "QUESTION_GENERATE_PROMPT_TEMPLATE",
     # 学习教练
     "TUTOR_SYSTEM_PROMPT",
     "TUTOR_FEEDBACK_PROMPT",
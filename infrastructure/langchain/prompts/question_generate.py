@@ -1,7 +1,12 @@
 """
 问题生成 Prompt 模版
+
+- QUESTION_GENERATE_PROMPT: 原始模版字符串（保持兼容）
+- QUESTION_GENERATE_PROMPT_TEMPLATE: 预编译的 PromptTemplate，占位符在模块加载时解析一次
 """
 
+from langchain_core.prompts import PromptTemplate
+
 QUESTION_GENERATE_PROMPT = """基于以下项目信息，生成学习问题。
 
 ## 项目画像
@@ -35,3 +40,4 @@ QUESTION_GENERATE_PROMPT = """基于以下项目信息，生成学习问题。
 
 请以 JSON 格式返回问题列表。"""
 
+QUESTION_GENERATE_PROMPT_TEMPLATE = PromptTemplate.from_template(QUESTION_GENERATE_PROMPT)
@@ -14,14 +14,25 @@ Retriever 配置模块 - RAG 检索组件
     >>> docs = await retriever.ainvoke("项目入口在哪里？")
 """
 
-from typing import Optional, Literal, List, Any
+import asyncio
+import weakref
+from functools import lru_cache
+from typing import Optional, Literal, List, Any, Tuple
+
+from cachetools import TTLCache
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.documents import Document
 
 from core.config import settings
 from core.logging_config import get_logger
-from .llm import get_llm
+from .llm import get_llm, is_retryable_error
 from .vectorstore import get_vectorstore
 from .exceptions import RetrieverError, RetrievalError
 
@@ -30,6 +41,21 @@ logger = get_logger(__name__)
 # 检索策略类型
 SearchType = Literal["similarity", "mmr", "similarity_score_threshold"]
 
+# 代码集合名前缀（与 CodeIndexer 写入的集合名保持一致）
+_CODE_COLL_PREFIX = "code_"
+
+
+def get_code_collection_name(project_id: str) -> str:
+    """获取项目代码片段所在的集合名称"""
+    return _CODE_COLL_PREFIX + project_id
+
+
+# 按规范化参数复用 Retriever：已被 LRU 淘汰但仍被压缩/多查询检索器引用的实例
+# 继续命中，不会重复构造；无人引用后随 GC 释放，不额外占用内存
+_retriever_cache: "weakref.WeakValueDictionary[tuple, BaseRetriever]" = (
+    weakref.WeakValueDictionary()
+)
+
 
 def get_code_retriever(
     project_id: str,
@@ -54,43 +80,85 @@ def get_code_retriever(
         lambda_mult: MMR 多样性参数 (0=最大多样性, 1=最大相关性)
     
     Returns:
-        BaseRetriever: LangChain Retriever 实例
+        BaseRetriever: LangChain Retriever 实例（等价参数复用同一实例）
+    
+    Note:
+        结果按 (集合名, 检索策略, 规范化后的检索参数) 缓存，不同写法但等价的
+        调用（如 fetch_k=None 与 fetch_k=search_k * 2）命中同一实例，避免每次
+        检索都重新创建 VectorStore 客户端。重新索引项目后可调用
+        clear_retriever_cache() 失效缓存。
     
     Example:
         >>> retriever = get_code_retriever("proj_123")
         >>> retriever = get_code_retriever("proj_123", search_type="mmr", search_k=20)
         >>> retriever = get_code_retriever("proj_123", search_type="similarity_score_threshold", score_threshold=0.7)
     """
-    collection_name = f"code_{project_id}"
-    vectorstore = get_vectorstore(collection_name)
-    
-    search_kwargs: dict[str, Any] = {"k": search_k}
-    
-    if search_type == "mmr":
-        search_kwargs["fetch_k"] = fetch_k or search_k * 2
-        search_kwargs["lambda_mult"] = lambda_mult
+    collection_name = get_code_collection_name(project_id)
+    search_kwargs_items = _build_search_kwargs(
+        search_type, search_k, score_threshold, fetch_k, lambda_mult
+    )
+    return _get_code_retriever(collection_name, search_type, search_kwargs_items)
+
+
+@lru_cache(maxsize=128)
+def _get_code_retriever(
+    collection_name: str,
+    search_type: SearchType,
+    search_kwargs_items: Tuple[Tuple[str, Any], ...],
+) -> BaseRetriever:
+    """按规范化参数获取 Retriever，LRU 持有最近使用的实例，弱引用表兜底复用"""
+    key = (collection_name, search_type, search_kwargs_items)
+    retriever = _retriever_cache.get(key)
+    if retriever is not None:
+        return retriever
     
-    if search_type == "similarity_score_threshold":
-        if score_threshold is None:
-            score_threshold = 0.5  # 默认阈值
-        search_kwargs["score_threshold"] = score_threshold
+    vectorstore = get_vectorstore(collection_name)
+    search_kwargs = dict(search_kwargs_items)
     
     retriever = vectorstore.as_retriever(
         search_type=search_type,
         search_kwargs=search_kwargs,
     )
+    _retriever_cache[key] = retriever
     
     logger.debug(
         "created_code_retriever",
         collection=collection_name,
         search_type=search_type,
-        search_k=search_k,
-        **({k: v for k, v in search_kwargs.items() if k != "k"}),
+        **search_kwargs,
     )
     
     return retriever
 
 
+@lru_cache(maxsize=64)
+def _build_search_kwargs(
+    search_type: SearchType,
+    search_k: int,
+    score_threshold: Optional[float],
+    fetch_k: Optional[int],
+    lambda_mult: float,
+) -> Tuple[Tuple[str, Any], ...]:
+    """
+    构建检索参数
+    
+    返回不可变的 (key, value) 元组以便缓存共享，调用方使用时转换为 dict。
+    """
+    search_kwargs: dict[str, Any] = {"k": search_k}
+    
+    if search_type == "mmr":
+        search_kwargs["fetch_k"] = fetch_k or search_k * 2
+        search_kwargs["lambda_mult"] = lambda_mult
+    
+    if search_type == "similarity_score_threshold":
+        if score_threshold is None:
+            score_threshold = 0.5  # 默认阈值
+        search_kwargs["score_threshold"] = score_threshold
+    
+    return tuple(search_kwargs.items())
+
+
+@lru_cache(maxsize=128)
 def get_document_retriever(
     collection_name: str,
     search_k: int = 5,
@@ -105,7 +173,7 @@ def get_document_retriever(
         search_type: 检索策略
     
     Returns:
-        BaseRetriever: Retriever 实例
+        BaseRetriever: Retriever 实例（相同参数复用同一实例）
     """
     vectorstore = get_vectorstore(collection_name)
     
@@ -127,6 +195,14 @@ def get_document_retriever(
     )
 
 
+def clear_retriever_cache() -> None:
+    """清除 Retriever 缓存（项目重新索引后调用）"""
+    _get_code_retriever.cache_clear()
+    _retriever_cache.clear()
+    get_document_retriever.cache_clear()
+    logger.debug("retriever_cache_cleared")
+
+
 # =============================================================================
 # 高级检索器
 # =============================================================================
@@ -144,8 +220,8 @@ def get_compressed_retriever(
     
     Args:
         project_id: 项目 ID
-        search_k: 返回文档数量（会先检索 2x 再压缩）
-        use_llm_filter: 是否使用 LLM 过滤
+        search_k: 返回文档数量（启用 LLM 过滤时会先检索 2x 再压缩）
+        use_llm_filter: 是否使用 LLM 过滤，为 False 时等价于 get_code_retriever
     
     Returns:
         BaseRetriever: 带压缩功能的 Retriever
@@ -153,24 +229,29 @@ def get_compressed_retriever(
     Note:
         LLM 过滤会增加延迟和成本，建议仅在需要高精度时使用。
     """
-    # 基础检索器检索更多文档，压缩后返回 search_k 个
-    base_retriever = get_code_retriever(project_id, search_k=search_k * 2)
-    
+    # 不做压缩时直接返回普通检索器，无需多检索一倍文档
     if not use_llm_filter:
-        return base_retriever
+        return get_code_retriever(project_id, search_k=search_k)
     
     try:
-        from langchain.retrievers import ContextualCompressionRetriever
-        from langchain.retrievers.document_compressors import LLMChainExtractor
+        try:
+            from langchain.retrievers import ContextualCompressionRetriever
+        except ImportError:
+            # langchain 1.x 将旧版 retrievers 移至 langchain-classic
+            from langchain_classic.retrievers import ContextualCompressionRetriever
+        extractor_cls = _get_parallel_chain_extractor_class()
     except ImportError:
         logger.warning(
             "compression_retriever_not_available",
             reason="langchain package required for ContextualCompressionRetriever",
         )
-        return base_retriever
+        return get_code_retriever(project_id, search_k=search_k)
+    
+    # 基础检索器检索更多文档，压缩后返回 search_k 个
+    base_retriever = get_code_retriever(project_id, search_k=search_k * 2)
     
     llm = get_llm()
-    compressor = LLMChainExtractor.from_llm(llm)
+    compressor = extractor_cls.from_llm(llm)
     
     logger.debug(
         "created_compressed_retriever",
@@ -185,6 +266,35 @@ def get_compressed_retriever(
     )
 
 
+@lru_cache(maxsize=1)
+def _get_parallel_chain_extractor_class() -> type:
+    """
+    构建并发压缩文档的 LLMChainExtractor 子类（延迟导入 langchain）
+    
+    默认的同步 compress_documents 对每个文档串行调用一次 LLM，
+    N 个文档需要 N 次 LLM 往返。这里改为 llm_chain.batch 在线程池中
+    并发调用，总耗时约为单次 LLM 调用延迟（异步路径本身已使用 abatch）。
+    """
+    try:
+        from langchain.retrievers.document_compressors import LLMChainExtractor
+    except ImportError:
+        from langchain_classic.retrievers.document_compressors import LLMChainExtractor
+    
+    class ParallelLLMChainExtractor(LLMChainExtractor):
+        """并发调用 LLM 压缩文档的 LLMChainExtractor"""
+        
+        def compress_documents(self, documents, query, callbacks=None) -> List[Document]:
+            inputs = [self.get_input(query, doc) for doc in documents]
+            outputs = self.llm_chain.batch(inputs, {"callbacks": callbacks})
+            return [
+                Document(page_content=output, metadata=doc.metadata)
+                for doc, output in zip(documents, outputs)
+                if output
+            ]
+    
+    return ParallelLLMChainExtractor
+
+
 def get_multi_query_retriever(
     project_id: str,
     search_k: int = 5,
@@ -208,7 +318,7 @@ def get_multi_query_retriever(
     base_retriever = get_code_retriever(project_id, search_k=search_k)
     
     try:
-        from langchain.retrievers.multi_query import MultiQueryRetriever
+        retriever_cls = _get_parallel_multi_query_retriever_class()
     except ImportError:
         logger.warning(
             "multi_query_retriever_not_available",
@@ -224,12 +334,73 @@ def get_multi_query_retriever(
         search_k=search_k,
     )
     
-    return MultiQueryRetriever.from_llm(
+    return retriever_cls.from_llm(
         retriever=base_retriever,
         llm=llm,
     )
 
 
+@lru_cache(maxsize=1)
+def _get_parallel_multi_query_retriever_class() -> type:
+    """
+    构建并发执行子查询的 MultiQueryRetriever 子类（延迟导入 langchain）
+    
+    - 同步路径：默认实现逐个执行子查询，这里改为 retriever.batch 在线程池中并发执行
+    - 异步路径：使用 retriever.abatch 并发执行
+    - 去重：按 (source, start_line) 合并同一代码片段，缺少位置信息时按内容去重
+    
+    总检索延迟约为单次子查询的往返时间，而不是 N 次之和。
+    """
+    try:
+        from langchain.retrievers.multi_query import MultiQueryRetriever
+    except ImportError:
+        # langchain 1.x 将旧版 retrievers 移至 langchain-classic
+        from langchain_classic.retrievers.multi_query import MultiQueryRetriever
+    
+    class ParallelMultiQueryRetriever(MultiQueryRetriever):
+        """并发执行子查询并按代码位置去重的 MultiQueryRetriever"""
+        
+        def retrieve_documents(self, queries, run_manager) -> List[Document]:
+            document_lists = self.retriever.batch(
+                queries,
+                config={"callbacks": run_manager.get_child()},
+            )
+            return [doc for docs in document_lists for doc in docs]
+        
+        async def aretrieve_documents(self, queries, run_manager) -> List[Document]:
+            document_lists = await self.retriever.abatch(
+                queries,
+                config={"callbacks": run_manager.get_child()},
+            )
+            return [doc for docs in document_lists for doc in docs]
+        
+        def unique_union(self, documents: List[Document]) -> List[Document]:
+            return _dedupe_documents_by_location(documents)
+    
+    return ParallelMultiQueryRetriever
+
+
+def _dedupe_documents_by_location(documents: List[Document]) -> List[Document]:
+    """按 (source, start_line) 去重并保持首次出现的顺序"""
+    seen: set = set()
+    unique: List[Document] = []
+    
+    for doc in documents:
+        metadata = doc.metadata
+        source = metadata.get("source")
+        start_line = metadata.get("start_line")
+        if source is not None and start_line is not None:
+            key = (source, start_line)
+        else:
+            key = doc.page_content
+        
+        if key not in seen:
+            seen.add(key)
+            unique.append(doc)
+    
+    return unique
+
+
 def get_ensemble_retriever(
     project_id: str,
     search_k: int = 10,
@@ -281,9 +452,86 @@ async def retrieve_code_chunks(
     Returns:
         List[Document]: 检索到的文档列表
     
+    Note:
+        结果按 (project_id, query, search_k, search_type) 缓存 5 分钟；同一个 key
+        的并发未命中只会执行一次检索。add_documents_to_collection 写入新文档后
+        会调用 clear_query_cache() 清除缓存。返回的文档是缓存的副本，可以自由修改。
+    
     Example:
         >>> docs = await retrieve_code_chunks("proj_123", "用户认证逻辑")
     """
+    key = (project_id, query, search_k, search_type)
+    
+    cached = _query_cache.get(key)
+    if cached is not None:
+        return _copy_documents(cached)
+    
+    lock = _query_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _query_locks[key] = lock
+    
+    async with lock:
+        # 等待锁期间可能已由其他请求填充
+        cached = _query_cache.get(key)
+        if cached is not None:
+            return _copy_documents(cached)
+        
+        documents = await _retrieve_code_chunks(project_id, query, search_k, search_type)
+        _query_cache[key] = documents
+        return _copy_documents(documents)
+
+
+def _copy_documents(documents: List[Document]) -> List[Document]:
+    """
+    复制缓存中的文档，调用方修改返回结果不影响缓存
+    
+    Chroma 的 metadata 只包含标量值，浅拷贝 metadata 字典即可。
+    """
+    return [
+        doc.model_copy(update={"metadata": dict(doc.metadata)})
+        for doc in documents
+    ]
+
+
+# 检索结果缓存：(project_id, query, search_k, search_type) -> List[Document]
+_query_cache: "TTLCache[Tuple[str, str, int, str], List[Document]]" = TTLCache(
+    maxsize=512,
+    ttl=300,
+)
+
+# 每个 key 的检索锁，防止冷 key 并发击穿；锁不再被引用时自动回收
+_query_locks: "weakref.WeakValueDictionary[Tuple[str, str, int, str], asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def clear_query_cache() -> None:
+    """清除检索结果缓存"""
+    _query_cache.clear()
+    logger.debug("query_cache_cleared")
+
+
+# 单次检索的最大尝试次数（含首次）
+_RETRIEVAL_MAX_ATTEMPTS = 3
+
+
+def _log_retrieval_retry(retry_state) -> None:
+    """检索重试前记录日志"""
+    logger.warning(
+        "retrieval_retry",
+        attempt=retry_state.attempt_number,
+        error=str(retry_state.outcome.exception()),
+    )
+
+
+async def _retrieve_code_chunks(
+    project_id: str,
+    query: str,
+    search_k: int,
+    search_type: SearchType,
+) -> List[Document]:
+    """执行一次代码片段检索，瞬时错误（超时、连接失败、5xx）按指数退避重试"""
     try:
         retriever = get_code_retriever(
             project_id=project_id,
@@ -291,7 +539,15 @@ async def retrieve_code_chunks(
             search_type=search_type,
         )
         
-        documents = await retriever.ainvoke(query)
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(_RETRIEVAL_MAX_ATTEMPTS),
+            wait=wait_exponential(multiplier=0.25, max=4),
+            retry=retry_if_exception(is_retryable_error),
+            before_sleep=_log_retrieval_retry,
+            reraise=True,
+        ):
+            with attempt:
+                documents = await retriever.ainvoke(query)
         
         logger.debug(
             "code_chunks_retrieved",
@@ -330,19 +586,30 @@ def format_retrieved_documents(
     Returns:
         str: 格式化后的文本
     """
-    formatted = []
-    
-    for i, doc in enumerate(documents, 1):
-        if include_metadata:
-            source = doc.metadata.get("source", "unknown")
-            start_line = doc.metadata.get("start_line", "?")
-            end_line = doc.metadata.get("end_line", "?")
-            language = doc.metadata.get("language", "")
-            
-            header = f"## [{i}] {source} (L{start_line}-{end_line})"
-            code_block = f"```{language}\n{doc.page_content}\n```"
-            formatted.append(f"{header}\n{code_block}")
-        else:
-            formatted.append(f"## [{i}]\n```\n{doc.page_content}\n```")
+    if not include_metadata:
+        return "\n\n".join(
+            _PLAIN_DOC_TEMPLATE.format(i, doc.page_content)
+            for i, doc in enumerate(documents, 1)
+        )
     
-    return "\n\n".join(formatted)
+    return "\n\n".join(
+        _format_document_with_metadata(i, doc) for i, doc in enumerate(documents, 1)
+    )
+
+
+# 文档格式化模版（模块加载时构建一次）
+_METADATA_DOC_TEMPLATE = "## [{}] {} (L{}-{})\n```{}\n{}\n```"
+_PLAIN_DOC_TEMPLATE = "## [{}]\n```\n{}\n```"
+
+
+def _format_document_with_metadata(index: int, doc: Document) -> str:
+    """格式化单个文档（包含来源、行号和语言）"""
+    metadata = doc.metadata
+    return _METADATA_DOC_TEMPLATE.format(
+        index,
+        metadata.get("source", "unknown"),
+        metadata.get("start_line", "?"),
+        metadata.get("end_line", "?"),
+        metadata.get("language", ""),
+        doc.page_content,
+    )
@@ -12,6 +12,8 @@
     >>> await vs.aadd_documents(documents)
 """
 
+import asyncio
+import uuid
 from typing import Optional, Literal, List, Any
 
 from langchain_core.vectorstores import VectorStore
@@ -19,7 +21,7 @@ from langchain_core.documents import Document
 
 from core.config import settings
 from core.logging_config import get_logger
-from .embeddings import get_embeddings
+from .embeddings import get_cached_embeddings
 from .exceptions import VectorStoreProviderError
 
 logger = get_logger(__name__)
@@ -27,6 +29,9 @@ logger = get_logger(__name__)
 # VectorStore 提供商类型（仅保留 chroma）
 VectorStoreProvider = Literal["chroma"]
 
+# 单次写入 Chroma collection 的最大文档数
+_CHROMA_ADD_CHUNK_SIZE = 5000
+
 
 # =============================================================================
 # VectorStore 工厂方法
@@ -58,7 +63,8 @@ def get_vectorstore(
     """
     # 强制只允许使用 Chroma
     provider = provider or "chroma"
-    embeddings = embeddings or get_embeddings()
+    # 复用进程内缓存的 Embeddings，避免重复加载模型
+    embeddings = embeddings or get_cached_embeddings()
     
     logger.debug(
         "creating_vectorstore",
@@ -203,39 +209,151 @@ async def add_documents_to_collection(
     documents: List[Document],
     provider: Optional[VectorStoreProvider] = None,
     batch_size: int = 100,
+    max_concurrency: int = 8,
 ) -> List[str]:
     """
     向集合添加文档
     
+    先按 batch_size 分批计算 Embedding（最多 max_concurrency 个批次并发，
+    每批都需要等待 Embedding 服务的网络往返），再将全部向量按
+    _CHROMA_ADD_CHUNK_SIZE 分块直接写入 Chroma collection，避免逐批
+    走 aadd_documents 的嵌入 + 写入流程。写入完成后清除检索结果缓存。
+    
     Args:
         collection_name: 集合名称
         documents: 文档列表
         provider: 向量库提供商
-        batch_size: 每批处理的文档数
+        batch_size: 每批嵌入的文档数
+        max_concurrency: 最大并发嵌入批次数
     
     Returns:
-        List[str]: 添加的文档 ID 列表
+        List[str]: 添加的文档 ID 列表（与输入文档顺序一致）
     """
     vectorstore = get_vectorstore(collection_name, provider=provider)
+    if not documents:
+        return []
     
-    all_ids: List[str] = []
+    texts = [doc.page_content for doc in documents]
+    ids = [doc.id or str(uuid.uuid4()) for doc in documents]
+    embeddings = vectorstore.embeddings
+    semaphore = asyncio.Semaphore(max_concurrency)
     
-    for i in range(0, len(documents), batch_size):
-        batch = documents[i:i + batch_size]
-        logger.debug(
-            "adding_documents_batch",
-            collection=collection_name,
-            batch_index=i // batch_size,
-            batch_size=len(batch),
-            total=len(documents),
+    async def _embed_batch(batch_index: int, start: int) -> List[List[float]]:
+        async with semaphore:
+            batch = texts[start:start + batch_size]
+            logger.debug(
+                "embedding_documents_batch",
+                collection=collection_name,
+                batch_index=batch_index,
+                batch_size=len(batch),
+                total=len(documents),
+            )
+            return await embeddings.aembed_documents(batch)
+    
+    results = await asyncio.gather(
+        *(
+            _embed_batch(index, start)
+            for index, start in enumerate(range(0, len(texts), batch_size))
         )
-        
-        ids = await vectorstore.aadd_documents(batch)
-        all_ids.extend(ids)
+    )
+    vectors = [vector for batch_vectors in results for vector in batch_vectors]
+    
+    await asyncio.to_thread(
+        _bulk_upsert_to_chroma,
+        vectorstore,
+        ids,
+        texts,
+        vectors,
+        [doc.metadata for doc in documents],
+    )
+    
+    # 新写入的代码片段需对检索可见，丢弃缓存的旧检索结果
+    from .retrievers import clear_query_cache
+    clear_query_cache()
     
     logger.info(
         "documents_added",
         collection=collection_name,
-        count=len(all_ids),
+        count=len(ids),
+    )
+    return ids
+
+
+def _bulk_upsert_to_chroma(
+    vectorstore: VectorStore,
+    ids: List[str],
+    texts: List[str],
+    vectors: List[List[float]],
+    metadatas: List[dict],
+) -> None:
+    """
+    将预先计算好的向量分块写入 Chroma collection
+    
+    Chroma 不接受空 metadata，有无 metadata 的文档分开写入（与 langchain_chroma 一致）。
+    """
+    collection = vectorstore._collection
+    
+    for start in range(0, len(ids), _CHROMA_ADD_CHUNK_SIZE):
+        indices = range(start, min(start + _CHROMA_ADD_CHUNK_SIZE, len(ids)))
+        with_metadata = [i for i in indices if metadatas[i]]
+        without_metadata = [i for i in indices if not metadatas[i]]
+        
+        if with_metadata:
+            collection.upsert(
+                ids=[ids[i] for i in with_metadata],
+                embeddings=[vectors[i] for i in with_metadata],
+                metadatas=[metadatas[i] for i in with_metadata],
+                documents=[texts[i] for i in with_metadata],
+            )
+        if without_metadata:
+            collection.upsert(
+                ids=[ids[i] for i in without_metadata],
+                embeddings=[vectors[i] for i in without_metadata],
+                documents=[texts[i] for i in without_metadata],
+            )
+
+
+# =============================================================================
+# 启动预热
+# =============================================================================
+
+async def warmup_vectorstores(project_ids: Optional[List[str]] = None) -> None:
+    """
+    预热 Embedding 模型、向量库客户端和项目检索器
+    
+    默认情况下这些资源在首个请求时才创建，首个请求需要承担模型加载、
+    Chroma 客户端初始化以及（远程 Embedding 的）TCP/TLS 握手耗时。
+    在应用启动时调用，使这部分开销在接收流量前完成。
+    
+    Args:
+        project_ids: 需要预先创建检索器的项目 ID 列表
+    
+    Note:
+        创建 Chroma VectorStore 会执行 get_or_create_collection。为避免配置中
+        拼错或过期的项目 ID 在启动时生成空集合，只为集合已存在的项目创建检索器，
+        其余 ID 记录警告后跳过。
+    """
+    from .retrievers import get_code_collection_name, get_code_retriever
+    
+    # 加载模型 / 创建客户端，并发起一次嵌入请求建立连接
+    embeddings = await asyncio.to_thread(get_cached_embeddings)
+    await embeddings.aembed_query("warmup")
+    
+    default_store = await asyncio.to_thread(get_vectorstore, settings.vectorstore.default_collection)
+    
+    project_ids = project_ids or []
+    if project_ids:
+        existing = {
+            collection.name
+            for collection in await asyncio.to_thread(default_store._client.list_collections)
+        }
+        missing = [pid for pid in project_ids if get_code_collection_name(pid) not in existing]
+        if missing:
+            logger.warning("vectorstore_warmup_collections_missing", project_ids=missing)
+        project_ids = [pid for pid in project_ids if pid not in missing]
+    
+    await asyncio.gather(
+        *(asyncio.to_thread(get_code_retriever, project_id) for project_id in project_ids)
     )
-    return all_ids
+    
+    logger.info("vectorstores_warmed_up", project_count=len(project_ids))
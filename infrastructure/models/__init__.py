@@ -8,11 +8,15 @@ from .base import (
     Base,
     BaseModel,
     PrefixedIDMixin,
+    PrefixedIDType,
     SoftDeleteMixin,
     TimestampMixin,
     UUIDPrimaryKeyMixin,
+    active_rows_index,
     generate_prefixed_uuid,
+    generate_prefixed_uuids,
     metadata,
+    now_utc,
 )
 from .enums import (
     AnalysisSectionType,
@@ -28,6 +32,7 @@ from .project import ProjectModel
 from .session import SessionModel
 from .question import QuestionModel
 from .learning_record import LearningRecordModel
+from .learning_record_payload import LearningRecordPayloadModel
 from .analysis_document import AnalysisDocumentModel
 from .note import NoteModel
 
@@ -44,7 +49,11 @@ __all__ = [
     "SoftDeleteMixin",
     "UUIDPrimaryKeyMixin",
     "PrefixedIDMixin",
+    "PrefixedIDType",
+    "active_rows_index",
     "generate_prefixed_uuid",
+    "generate_prefixed_uuids",
+    "now_utc",
     # 枚举
     "ProjectStatus",
     "SessionStatus",
@@ -57,6 +66,7 @@ __all__ = [
     "SessionModel",
     "QuestionModel",
     "LearningRecordModel",
+    "LearningRecordPayloadModel",
     "AnalysisDocumentModel",
     "NoteModel",
     # 原有模型
@@ -4,20 +4,28 @@
 存储由 Analysis Generator Agent 生成的九大章节分析文档。
 """
 
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel, generate_prefixed_uuid
+from .base import (
+    BaseModel,
+    PrefixedIDMixin,
+    PrefixedIDType,
+    active_rows_index,
+    enum_column_type,
+    generate_prefixed_uuid,
+)
 from .enums import AnalysisSectionType
 
 if TYPE_CHECKING:
     from .project import ProjectModel
 
 
-class AnalysisDocumentModel(BaseModel):
+class AnalysisDocumentModel(PrefixedIDMixin, BaseModel):
     """
     分析文档模型
     
@@ -38,6 +46,7 @@ class AnalysisDocumentModel(BaseModel):
     __table_args__ = (
         Index("ix_analysis_documents_project_id", "project_id"),
         Index("ix_analysis_documents_section_type", "section_type"),
+        active_rows_index("analysis_documents", "project_id"),
         UniqueConstraint(
             "project_id", "section_type", "version",
             name="uq_analysis_documents_project_section_version"
@@ -48,26 +57,40 @@ class AnalysisDocumentModel(BaseModel):
     )
     
     _id_prefix = "doc"
+    _repr_fields = ("id", "project_id", "section_type", "version")
+    
+    # 章节类型 -> 默认排序索引（类加载时构建一次）
+    _SECTION_ORDER = {
+        AnalysisSectionType.EXECUTIVE_SUMMARY.value: 1,
+        AnalysisSectionType.SYSTEM_ARCHITECTURE.value: 2,
+        AnalysisSectionType.CORE_COMPONENTS.value: 3,
+        AnalysisSectionType.DATA_FLOW.value: 4,
+        AnalysisSectionType.KEY_ALGORITHMS.value: 5,
+        AnalysisSectionType.EXTENSION_POINTS.value: 6,
+        AnalysisSectionType.DEPENDENCY_ANALYSIS.value: 7,
+        AnalysisSectionType.BEST_PRACTICES.value: 8,
+        AnalysisSectionType.LEARNING_ROADMAP.value: 9,
+    }
     
     # 主键
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
-        default=lambda: generate_prefixed_uuid("doc"),
+        default=partial(generate_prefixed_uuid, "doc"),
         comment="文档 ID，格式：doc_xxxxxxxxxxxx",
     )
     
     # 关联项目
     project_id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         comment="关联的项目 ID",
     )
     
     # 章节信息
-    section_type: Mapped[str] = mapped_column(
-        String(50),
+    section_type: Mapped[AnalysisSectionType] = mapped_column(
+        enum_column_type(AnalysisSectionType, "analysis_section_type"),
         nullable=False,
         comment="章节类型：executive_summary, system_architecture, core_components 等",
     )
@@ -117,25 +140,7 @@ class AnalysisDocumentModel(BaseModel):
         back_populates="analysis_documents",
     )
     
-    def __repr__(self) -> str:
-        return (
-            f"<AnalysisDocumentModel(id={self.id}, project_id={self.project_id}, "
-            f"section='{self.section_type}', version={self.version})>"
-        )
-    
     @classmethod
     def get_section_order(cls, section_type: str) -> int:
         """获取章节的默认排序索引"""
-        order_map = {
-            AnalysisSectionType.EXECUTIVE_SUMMARY.value: 1,
-            AnalysisSectionType.SYSTEM_ARCHITECTURE.value: 2,
-            AnalysisSectionType.CORE_COMPONENTS.value: 3,
-            AnalysisSectionType.DATA_FLOW.value: 4,
-            AnalysisSectionType.KEY_ALGORITHMS.value: 5,
-            AnalysisSectionType.EXTENSION_POINTS.value: 6,
-            AnalysisSectionType.DEPENDENCY_ANALYSIS.value: 7,
-            AnalysisSectionType.BEST_PRACTICES.value: 8,
-            AnalysisSectionType.LEARNING_ROADMAP.value: 9,
-        }
-        return order_map.get(section_type, 99)
-
+        return cls._SECTION_ORDER.get(section_type, 99)
@@ -7,16 +7,32 @@
 - 软删除支持（deleted_at）
 """
 
+import os
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from enum import Enum
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Optional
 
-from sqlalchemy import DateTime, String, event
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import DateTime, Index, String, Uuid, event, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import DeclarativeBase, Mapped, Mapper, mapped_column
 from sqlalchemy.sql import func
 
 
+_UTC = timezone.utc
+
+
+def now_utc() -> datetime:
+    """
+    返回当前 UTC 时间。
+    
+    作为时间戳列的默认值函数使用；批量插入时调用一次，整批共用同一个值。
+    """
+    return datetime.now(_UTC)
+
+
 def generate_prefixed_uuid(prefix: str) -> str:
     """
     生成带前缀的 UUID。
@@ -27,7 +43,54 @@ def generate_prefixed_uuid(prefix: str) -> str:
     Returns:
         带前缀的 UUID 字符串，格式：prefix_xxxxxxxx
     """
-    return f"{prefix}_{uuid.uuid4().hex[:12]}"
+    # 直接取 6 个随机字节转为 12 位十六进制，不构造 UUID 对象
+    return prefix + "_" + os.urandom(6).hex()
+
+
+def generate_prefixed_uuids(prefix: str, n: int) -> list[str]:
+    """
+    批量生成带前缀的 UUID。
+    
+    一次 os.urandom 调用取出 n 个 ID 所需的随机字节再切片，
+    用于批量插入前预先分配主键，避免逐行生成。
+    
+    Args:
+        prefix: 前缀字符串，如 'q', 'lr'
+        n: 生成数量
+    
+    Returns:
+        带前缀的 UUID 字符串列表，格式与 generate_prefixed_uuid 一致
+    """
+    hex_str = os.urandom(6 * n).hex()
+    return [f"{prefix}_{hex_str[i:i + 12]}" for i in range(0, 12 * n, 12)]
+
+
+# 带前缀 ID 列（主键及引用它的外键）的类型。
+# PostgreSQL 上使用 "C" 排序规则按字节比较，索引查找和外键连接不走 locale 感知的字符串比较。
+PrefixedIDType = String(50).with_variant(String(50, collation="C"), "postgresql")
+
+
+def _enum_values(enum_cls: type[Enum]) -> list[str]:
+    return [member.value for member in enum_cls]
+
+
+def enum_column_type(enum_cls: type[Enum], name: str) -> SQLEnum:
+    """
+    构建枚举列类型。
+    
+    PostgreSQL 上使用原生 ENUM（每个值 4 字节，比较和排序按枚举定义顺序），
+    其他数据库退化为 VARCHAR。库中存储的是枚举值（如 'pending'）而不是成员名。
+    
+    Args:
+        enum_cls: 枚举类
+        name: PostgreSQL 枚举类型名，如 'project_status'
+    """
+    return SQLEnum(
+        enum_cls,
+        name=name,
+        native_enum=True,
+        values_callable=_enum_values,
+    )
 
 
 class Base(DeclarativeBase):
@@ -49,7 +112,7 @@ class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        default=now_utc,
         server_default=func.now(),
         comment="创建时间",
     )
@@ -57,7 +120,7 @@ class TimestampMixin:
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        default=now_utc,
         server_default=func.now(),
         onupdate=func.now(),
         comment="更新时间",
@@ -85,24 +148,44 @@ class SoftDeleteMixin:
     
     def soft_delete(self) -> None:
         """执行软删除"""
-        self.deleted_at = datetime.now(timezone.utc)
+        self.deleted_at = now_utc()
     
     def restore(self) -> None:
         """恢复软删除的记录"""
         self.deleted_at = None
 
 
+def active_rows_index(table_name: str, *columns: str) -> Index:
+    """
+    构建仅包含未软删除行的部分索引（deleted_at IS NULL）。
+    
+    列表查询都带 deleted_at IS NULL 条件，部分索引只覆盖存活行，
+    体积更小且不会扫描已删除的记录。PostgreSQL 与 SQLite 均支持。
+    
+    Args:
+        table_name: 表名，用于生成索引名 ix_<table>_active
+        columns: 索引列（通常为列表查询的过滤列）
+    """
+    return Index(
+        f"ix_{table_name}_active",
+        *columns,
+        postgresql_where=text("deleted_at IS NULL"),
+        sqlite_where=text("deleted_at IS NULL"),
+    )
+
+
 class UUIDPrimaryKeyMixin:
     """
     UUID 主键 Mixin
     
-    使用 UUID 作为主键，支持 PostgreSQL 原生 UUID 类型。
+    使用 UUID 作为主键：PostgreSQL 上为原生 UUID 类型（16 字节），
+    其他数据库为 CHAR(32) 十六进制字符串。
     """
     
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid.uuid4,
         comment="主键 UUID",
     )
 
@@ -113,12 +196,21 @@ class PrefixedIDMixin:
     
     子类需要定义 _id_prefix 类属性来指定前缀。
     例如：_id_prefix = "proj" 会生成 "proj_xxxxxxxxxxxx" 格式的 ID
+    
+    定义了前缀的子类在创建时会把 generate_id / generate_ids 特化为绑定前缀的
+    partial，调用时不再读取 _id_prefix 或判断分支。
     """
     
     _id_prefix: str = ""  # 子类需覆盖此属性
     
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        if cls._id_prefix:
+            cls.generate_id = staticmethod(partial(generate_prefixed_uuid, cls._id_prefix))
+            cls.generate_ids = staticmethod(partial(generate_prefixed_uuids, cls._id_prefix))
+        super().__init_subclass__(**kwargs)
+    
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
         comment="带前缀的主键 ID",
     )
@@ -129,14 +221,26 @@ class PrefixedIDMixin:
         if not cls._id_prefix:
             return str(uuid.uuid4())
         return generate_prefixed_uuid(cls._id_prefix)
+    
+    @classmethod
+    def generate_ids(cls, n: int) -> list[str]:
+        """批量生成 n 个带前缀的 ID（用于批量插入前预分配主键）"""
+        if not cls._id_prefix:
+            return [str(uuid.uuid4()) for _ in range(n)]
+        return generate_prefixed_uuids(cls._id_prefix, n)
 
 
-def set_prefixed_id(mapper, connection, target):
-    """
-    事件监听器：在插入前自动设置带前缀的 ID。
-    """
-    if hasattr(target, '_id_prefix') and target._id_prefix and not target.id:
-        target.id = target.generate_id()
+_REPR_MAX_LENGTH = 30
+
+
+def _repr_value(value: Any) -> str:
+    """__repr__ 字段值格式化：字符串加引号，过长时截断"""
+    if isinstance(value, str):
+        value = str(value)
+        if len(value) > _REPR_MAX_LENGTH:
+            value = value[:_REPR_MAX_LENGTH] + "..."
+        return f"'{value}'"
+    return str(value)
 
 
 class BaseModel(Base, TimestampMixin, SoftDeleteMixin):
@@ -152,19 +256,54 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin):
     
     __abstract__ = True
     
+    # __repr__ 中输出的字段
+    _repr_fields: ClassVar[tuple[str, ...]] = ("id",)
+    
+    # 列名元组与列值取值器，映射配置完成时由 _cache_column_accessors 填充
+    _column_names: ClassVar[tuple[str, ...]]
+    _column_getter: ClassVar[Callable[[Any], tuple]]
+    
     def to_dict(self) -> dict[str, Any]:
         """
         将模型转换为字典。
         
         Returns:
-            包含所有列值的字典
+            包含所有列值的字典（键为数据库列名）
         """
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return dict(zip(self._column_names, self._column_getter(self)))
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _repr_accessor(cls) -> tuple[str, Callable[[Any], tuple]]:
+        """按类缓存 (__repr__ 格式模板, _repr_fields 取值器)"""
+        template = "<%s(%s)>" % (
+            cls.__name__,
+            ", ".join(f"{name}={{}}" for name in cls._repr_fields),
+        )
+        if len(cls._repr_fields) == 1:
+            single = attrgetter(cls._repr_fields[0])
+            return template, lambda obj: (single(obj),)
+        return template, attrgetter(*cls._repr_fields)
     
     def __repr__(self) -> str:
-        """返回模型的字符串表示"""
-        pk = getattr(self, 'id', None)
-        return f"<{self.__class__.__name__}(id={pk})>"
+        """返回模型的字符串表示（字段由 _repr_fields 指定）"""
+        template, getter = type(self)._repr_accessor()
+        return template.format(*map(_repr_value, getter(self)))
+
+
+@event.listens_for(BaseModel, "mapper_configured", propagate=True)
+def _cache_column_accessors(mapper: Mapper, cls: type[BaseModel]) -> None:
+    """
+    映射配置完成时为每个模型类预先计算 (列名元组, 列值取值器)。
+    
+    取值使用映射属性名，列名与属性名不同时（如 metadata_json -> "metadata"）
+    也能取到正确的值。
+    """
+    columns = cls.__table__.columns
+    cls._column_names = tuple(column.name for column in columns)
+    keys = tuple(mapper.get_property_by_column(column).key for column in columns)
+    if len(keys) == 1:
+        single = attrgetter(keys[0])
+        cls._column_getter = staticmethod(lambda obj: (single(obj),))
+    else:
+        cls._column_getter = attrgetter(*keys)
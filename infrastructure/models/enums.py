@@ -5,9 +5,45 @@
 """
 
 from enum import Enum
+from functools import lru_cache
+from typing import ClassVar, TypeVar
 
+_E = TypeVar("_E", bound="_ValueEnum")
 
-class ProjectStatus(str, Enum):
+
+class _ValueEnum(str, Enum):
+    """
+    字符串枚举基类
+    
+    列类型为原生枚举后读出的是枚举成员；str() 和格式化输出枚举值（如 'pending'），
+    与之前字符串列的表现一致。
+    
+    每个子类定义时预先生成 VALUES（全部枚举值的 frozenset），
+    校验字符串是否合法时直接 `value in XxxEnum.VALUES`，不必构造枚举实例。
+    """
+    
+    VALUES: ClassVar[frozenset[str]]
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.VALUES = frozenset(member.value for member in cls)
+    
+    def __str__(self) -> str:
+        return self.value
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def parse(cls: type[_E], value: str) -> _E:
+        """
+        将字符串解析为枚举成员（结果按值缓存）。
+        
+        Raises:
+            ValueError: 值不属于该枚举
+        """
+        return cls(value)
+
+
+class ProjectStatus(_ValueEnum):
     """项目状态枚举"""
     
     PENDING = "pending"
@@ -29,7 +65,7 @@ class ProjectStatus(str, Enum):
     """失败 - 项目分析失败"""
 
 
-class SessionStatus(str, Enum):
+class SessionStatus(_ValueEnum):
     """学习会话状态枚举"""
     
     ACTIVE = "active"
@@ -45,7 +81,7 @@ class SessionStatus(str, Enum):
     """已放弃 - 会话被用户放弃"""
 
 
-class LearningMode(str, Enum):
+class LearningMode(_ValueEnum):
     """学习模式枚举"""
     
     MACRO = "macro"
@@ -55,7 +91,7 @@ class LearningMode(str, Enum):
     """能力深挖 - 深入学习特定能力模块"""
 
 
-class LearningStage(str, Enum):
+class LearningStage(_ValueEnum):
     """学习阶段枚举"""
     
     # 宏观学习阶段
@@ -85,7 +121,7 @@ class LearningStage(str, Enum):
     """能力实践 - 动手练习"""
 
 
-class QuestionDifficulty(str, Enum):
+class QuestionDifficulty(_ValueEnum):
     """问题难度枚举"""
     
     BEGINNER = "beginner"
@@ -101,7 +137,7 @@ class QuestionDifficulty(str, Enum):
     """专家 - 深度探索"""
 
 
-class AnalysisSectionType(str, Enum):
+class AnalysisSectionType(_ValueEnum):
     """分析文档章节类型枚举（九大章节）"""
     
     EXECUTIVE_SUMMARY = "executive_summary"
@@ -0,0 +1,85 @@
+"""
+学习记录内容模型 (LearningRecordPayload)
+
+存储学习记录的大字段：用户回答、评估结果、讲解内容和反馈。
+与 LearningRecordModel 一对一，拆分后统计类查询无需读取这些大字段。
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import ForeignKey, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base, PrefixedIDType
+
+if TYPE_CHECKING:
+    from .learning_record import LearningRecordModel
+
+
+class LearningRecordPayloadModel(Base):
+    """
+    学习记录内容模型
+
+    以学习记录 ID 作为主键，随学习记录级联删除。生命周期完全跟随学习记录，
+    因此直接继承 Base：不带时间戳和软删除字段，也不参与全局软删除过滤。
+
+    Attributes:
+        record_id: 关联的学习记录 ID
+        answer: 用户的回答内容
+        evaluation: 评估结果 JSON（由 Tutor Agent 生成）
+        explanation: 讲解内容 JSON（由 Explainer Agent 生成）
+        feedback: Tutor 的反馈
+    """
+
+    __tablename__ = "learning_record_payloads"
+    __table_args__ = {
+        "comment": "学习记录内容表，存储回答、评估和讲解等大字段",
+    }
+
+    # 主键（同时为外键）
+    record_id: Mapped[str] = mapped_column(
+        PrefixedIDType,
+        ForeignKey("learning_records.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="关联的学习记录 ID",
+    )
+
+    # 回答内容
+    answer: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="用户的回答内容",
+    )
+
+    # 评估结果 (JSONB)
+    evaluation: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        default=None,
+        comment="评估结果 JSON，包含各要点的匹配情况",
+    )
+
+    # 讲解内容 (JSONB)
+    explanation: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        default=None,
+        comment="讲解内容 JSON（由 Explainer Agent 生成）",
+    )
+
+    # Tutor 反馈
+    feedback: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Tutor 的反馈和引导",
+    )
+
+    # 关系
+    record: Mapped["LearningRecordModel"] = relationship(
+        "LearningRecordModel",
+        back_populates="payload",
+    )
+    
+    def __repr__(self) -> str:
+        return f"<LearningRecordPayloadModel(record_id={self.record_id})>"
@@ -4,20 +4,27 @@
 存储用户在学习过程中的笔记和高亮内容。
 """
 
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel, generate_prefixed_uuid
+from .base import (
+    BaseModel,
+    PrefixedIDMixin,
+    PrefixedIDType,
+    active_rows_index,
+    generate_prefixed_uuid,
+)
 
 if TYPE_CHECKING:
     from .question import QuestionModel
     from .session import SessionModel
 
 
-class NoteModel(BaseModel):
+class NoteModel(PrefixedIDMixin, BaseModel):
     """
     笔记模型
     
@@ -40,24 +47,26 @@ class NoteModel(BaseModel):
         Index("ix_notes_session_id", "session_id"),
         Index("ix_notes_question_id", "question_id"),
         Index("ix_notes_created_at", "created_at"),
+        active_rows_index("notes", "session_id"),
         {
             "comment": "笔记表，存储用户的学习笔记",
         },
     )
     
     _id_prefix = "note"
+    _repr_fields = ("id", "title")
     
     # 主键
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
-        default=lambda: generate_prefixed_uuid("note"),
+        default=partial(generate_prefixed_uuid, "note"),
         comment="笔记 ID，格式：note_xxxxxxxxxxxx",
     )
     
     # 关联会话（必需）
     session_id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         ForeignKey("sessions.id", ondelete="CASCADE"),
         nullable=False,
         comment="关联的会话 ID",
@@ -65,7 +74,7 @@ class NoteModel(BaseModel):
     
     # 关联问题（可选）
     question_id: Mapped[Optional[str]] = mapped_column(
-        String(50),
+        PrefixedIDType,
         ForeignKey("questions.id", ondelete="SET NULL"),
         nullable=True,
         comment="关联的问题 ID（可选）",
@@ -125,8 +134,3 @@ class NoteModel(BaseModel):
         "QuestionModel",
         back_populates="notes",
     )
-    
-    def __repr__(self) -> str:
-        title_preview = self.title[:20] if self.title else "Untitled"
-        return f"<NoteModel(id={self.id}, title='{title_preview}...')>"
-
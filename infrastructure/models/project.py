@@ -5,13 +5,21 @@
 """
 
 import uuid
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Index, String, Text, event
+from sqlalchemy import DDL, Index, String, Text, event
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel, generate_prefixed_uuid
+from .base import (
+    BaseModel,
+    PrefixedIDMixin,
+    PrefixedIDType,
+    active_rows_index,
+    enum_column_type,
+    generate_prefixed_uuid,
+)
 from .enums import ProjectStatus
 
 if TYPE_CHECKING:
@@ -20,7 +28,7 @@ if TYPE_CHECKING:
     from .session import SessionModel
 
 
-class ProjectModel(BaseModel):
+class ProjectModel(PrefixedIDMixin, BaseModel):
     """
     项目模型
     
@@ -47,18 +55,20 @@ class ProjectModel(BaseModel):
         Index("ix_projects_status", "status"),
         Index("ix_projects_archetype", "archetype"),
         Index("ix_projects_created_at", "created_at"),
+        active_rows_index("projects", "created_at"),
         {
             "comment": "项目表，存储待学习的代码仓库信息",
         },
     )
     
     _id_prefix = "proj"
+    _repr_fields = ("id", "name", "status")
     
     # 主键
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
-        default=lambda: generate_prefixed_uuid("proj"),
+        default=partial(generate_prefixed_uuid, "proj"),
         comment="项目 ID，格式：proj_xxxxxxxxxxxx",
     )
     
@@ -101,6 +111,8 @@ class ProjectModel(BaseModel):
     )
     
     # 分析数据 (JSONB)
+    # profile / repo_map 体积大、由 Agent 一次性写入后整体读取，PostgreSQL 上
+    # 设置 STORAGE EXTERNAL：行外存储且不压缩，读取时免去 pglz 解压（见文件末尾 DDL）
     profile: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
@@ -123,10 +135,11 @@ class ProjectModel(BaseModel):
     )
     
     # 状态管理
-    status: Mapped[str] = mapped_column(
-        String(20),
+    status: Mapped[ProjectStatus] = mapped_column(
+        enum_column_type(ProjectStatus, "project_status"),
         nullable=False,
-        default=ProjectStatus.PENDING.value,
+        default=ProjectStatus.PENDING,
+        server_default=ProjectStatus.PENDING.value,
         comment="项目状态：pending, cloning, analyzing, indexing, ready, failed",
     )
     
@@ -143,28 +156,37 @@ class ProjectModel(BaseModel):
         comment="本地克隆路径",
     )
     
-    # 关系
+    # 关系（集合不隐式加载，需要时通过 selectinload 显式加载）
     sessions: Mapped[list["SessionModel"]] = relationship(
         "SessionModel",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     
     questions: Mapped[list["QuestionModel"]] = relationship(
         "QuestionModel",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     
     analysis_documents: Mapped[list["AnalysisDocumentModel"]] = relationship(
         "AnalysisDocumentModel",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
-    
-    def __repr__(self) -> str:
-        return f"<ProjectModel(id={self.id}, name='{self.name}', status='{self.status}')>"
 
+
+# 行外存储的大 JSONB 列（与迁移 9d4a2c7e5b16 保持一致，create_all 建表时同样生效）
+_EXTERNAL_STORAGE_COLUMNS = ("profile", "repo_map")
+
+for _column in _EXTERNAL_STORAGE_COLUMNS:
+    event.listen(
+        ProjectModel.__table__,
+        "after_create",
+        DDL(
+            f"ALTER TABLE projects ALTER COLUMN {_column} SET STORAGE EXTERNAL"
+        ).execute_if(dialect="postgresql"),
+    )
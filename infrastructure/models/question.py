@@ -4,13 +4,21 @@
 存储为项目生成的学习问题，包括问题内容、难度、关联文件等。
 """
 
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import BaseModel, generate_prefixed_uuid
+from .base import (
+    BaseModel,
+    PrefixedIDMixin,
+    PrefixedIDType,
+    active_rows_index,
+    enum_column_type,
+    generate_prefixed_uuid,
+)
 from .enums import LearningStage, QuestionDifficulty
 
 if TYPE_CHECKING:
@@ -19,7 +27,7 @@ if TYPE_CHECKING:
     from .project import ProjectModel
 
 
-class QuestionModel(BaseModel):
+class QuestionModel(PrefixedIDMixin, BaseModel):
     """
     问题模型
     
@@ -44,29 +52,35 @@ class QuestionModel(BaseModel):
     
     __tablename__ = "questions"
     __table_args__ = (
-        Index("ix_questions_project_id", "project_id"),
         Index("ix_questions_stage", "stage"),
         Index("ix_questions_difficulty", "difficulty"),
         Index("ix_questions_capability_module", "capability_module"),
-        Index("ix_questions_project_stage", "project_id", "stage"),
+        active_rows_index("questions", "project_id"),
+        # 覆盖 project_id / (project_id, stage) 前缀查询；INCLUDE 列表字段以支持仅索引扫描
+        Index(
+            "ix_questions_project_stage_order",
+            "project_id", "stage", "order_index",
+            postgresql_include=["title", "difficulty"],
+        ),
         {
             "comment": "问题表，存储为项目生成的学习问题",
         },
     )
     
     _id_prefix = "q"
+    _repr_fields = ("id", "title", "stage", "difficulty")
     
     # 主键
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
-        default=lambda: generate_prefixed_uuid("q"),
+        default=partial(generate_prefixed_uuid, "q"),
         comment="问题 ID，格式：q_xxxxxxxxxxxx",
     )
     
     # 关联项目
     project_id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         comment="关联的项目 ID",
@@ -93,17 +107,19 @@ class QuestionModel(BaseModel):
     )
     
     # 分类和难度
-    stage: Mapped[str] = mapped_column(
-        String(50),
+    stage: Mapped[LearningStage] = mapped_column(
+        enum_column_type(LearningStage, "learning_stage"),
         nullable=False,
-        default=LearningStage.OVERVIEW.value,
+        default=LearningStage.OVERVIEW,
+        server_default=LearningStage.OVERVIEW.value,
         comment="所属学习阶段",
     )
     
-    difficulty: Mapped[str] = mapped_column(
-        String(20),
+    difficulty: Mapped[QuestionDifficulty] = mapped_column(
+        enum_column_type(QuestionDifficulty, "question_difficulty"),
         nullable=False,
-        default=QuestionDifficulty.INTERMEDIATE.value,
+        default=QuestionDifficulty.INTERMEDIATE,
+        server_default=QuestionDifficulty.INTERMEDIATE.value,
         comment="问题难度：beginner, intermediate, advanced, expert",
     )
     
@@ -157,7 +173,7 @@ class QuestionModel(BaseModel):
         comment="关联的能力模块",
     )
     
-    # 关系
+    # 关系（集合不隐式加载，需要时通过 selectinload 显式加载）
     project: Mapped["ProjectModel"] = relationship(
         "ProjectModel",
         back_populates="questions",
@@ -167,19 +183,12 @@ class QuestionModel(BaseModel):
         "LearningRecordModel",
         back_populates="question",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     
     notes: Mapped[list["NoteModel"]] = relationship(
         "NoteModel",
         back_populates="question",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<QuestionModel(id={self.id}, title='{self.title[:30]}...', "
-            f"stage='{self.stage}', difficulty='{self.difficulty}')>"
-        )
-
@@ -4,13 +4,21 @@
 存储用户的学习会话信息，包括学习模式、进度、选中的能力模块等。
 """
 
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, WriteOnlyMapped, mapped_column, relationship
 
-from .base import BaseModel, generate_prefixed_uuid
+from .base import (
+    BaseModel,
+    PrefixedIDMixin,
+    PrefixedIDType,
+    active_rows_index,
+    enum_column_type,
+    generate_prefixed_uuid,
+)
 from .enums import LearningMode, LearningStage, SessionStatus
 
 if TYPE_CHECKING:
@@ -19,7 +27,7 @@ if TYPE_CHECKING:
     from .project import ProjectModel
 
 
-class SessionModel(BaseModel):
+class SessionModel(PrefixedIDMixin, BaseModel):
     """
     学习会话模型
     
@@ -42,41 +50,45 @@ class SessionModel(BaseModel):
         Index("ix_sessions_status", "status"),
         Index("ix_sessions_learning_mode", "learning_mode"),
         Index("ix_sessions_created_at", "created_at"),
+        active_rows_index("sessions", "project_id"),
         {
             "comment": "学习会话表，跟踪用户的学习进度",
         },
     )
     
     _id_prefix = "sess"
+    _repr_fields = ("id", "project_id", "learning_mode", "status")
     
     # 主键
     id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         primary_key=True,
-        default=lambda: generate_prefixed_uuid("sess"),
+        default=partial(generate_prefixed_uuid, "sess"),
         comment="会话 ID，格式：sess_xxxxxxxxxxxx",
     )
     
     # 关联项目
     project_id: Mapped[str] = mapped_column(
-        String(50),
+        PrefixedIDType,
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
         comment="关联的项目 ID",
     )
     
     # 学习配置
-    learning_mode: Mapped[str] = mapped_column(
-        String(20),
+    learning_mode: Mapped[LearningMode] = mapped_column(
+        enum_column_type(LearningMode, "learning_mode"),
         nullable=False,
-        default=LearningMode.MACRO.value,
+        default=LearningMode.MACRO,
+        server_default=LearningMode.MACRO.value,
         comment="学习模式：macro（宏观学习）, capability（能力深挖）",
     )
     
-    current_stage: Mapped[str] = mapped_column(
-        String(50),
+    current_stage: Mapped[LearningStage] = mapped_column(
+        enum_column_type(LearningStage, "learning_stage"),
         nullable=False,
-        default=LearningStage.OVERVIEW.value,
+        default=LearningStage.OVERVIEW,
+        server_default=LearningStage.OVERVIEW.value,
         comment="当前学习阶段",
     )
     
@@ -96,10 +108,11 @@ class SessionModel(BaseModel):
     )
     
     # 状态管理
-    status: Mapped[str] = mapped_column(
-        String(20),
+    status: Mapped[SessionStatus] = mapped_column(
+        enum_column_type(SessionStatus, "session_status"),
         nullable=False,
-        default=SessionStatus.ACTIVE.value,
+        default=SessionStatus.ACTIVE,
+        server_default=SessionStatus.ACTIVE.value,
         comment="会话状态：active, paused, completed, abandoned",
     )
     
@@ -110,29 +123,24 @@ class SessionModel(BaseModel):
         comment="会话总结（完成时生成）",
     )
     
-    # 关系
+    # 关系（学习记录和笔记为只写集合：只追加，读取时通过 .select() 分页查询）
     project: Mapped["ProjectModel"] = relationship(
         "ProjectModel",
         back_populates="sessions",
     )
     
-    learning_records: Mapped[list["LearningRecordModel"]] = relationship(
+    learning_records: WriteOnlyMapped["LearningRecordModel"] = relationship(
         "LearningRecordModel",
         back_populates="session",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="write_only",
     )
     
-    notes: Mapped[list["NoteModel"]] = relationship(
+    notes: WriteOnlyMapped["NoteModel"] = relationship(
         "NoteModel",
         back_populates="session",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="write_only",
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<SessionModel(id={self.id}, project_id={self.project_id}, "
-            f"mode='{self.learning_mode}', status='{self.status}')>"
-        )
-
@@ -1,6 +1,8 @@
 """
 FastAPI应用主入口
 """
+import asyncio
+
 from fastapi import FastAPI, Request
 from starlette.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -77,6 +79,17 @@ async def lifespan(app: FastAPI):
             error=str(exc),
         )
 
+    # 预热 Embedding 与向量库（可选），避免首个请求承担加载与握手耗时
+    if settings.vectorstore.warmup_on_startup:
+        try:
+            from infrastructure.langchain import warmup_vectorstores
+            await warmup_vectorstores(settings.vectorstore.warmup_project_ids)
+        except Exception as exc:
+            logger.error(
+                "vectorstore_warmup_failed",
+                error=str(exc),
+            )
+
     yield
     # 关闭时的清理工作
     if settings.redis.url:
@@ -86,6 +99,11 @@ async def lifespan(app: FastAPI):
     # 关闭存储服务
     await shutdown_storage_client()
     logger.info("storage_shutdown", message="Storage service shutdown")
+
+    # 关闭 LLM 共享连接池和 Embedding 进程池（进程池等待子进程退出，放到线程中执行）
+    from infrastructure.langchain import close_llm_http_clients, shutdown_embedding_process_pools
+    await close_llm_http_clients()
+    await asyncio.to_thread(shutdown_embedding_process_pools)
     logger.info("application_shutdown", message="Application shutdown")
 
 
@@ -0,0 +1,88 @@
+"""
+特征词匹配器
+
+特征表形如 {枚举: 特征记录}，特征记录是每个类别一个 frozenset 字段的冻结 dataclass。
+匹配器将所有特征词编译为一个正则交替式，对路径或依赖清单文本做一次扫描
+即可得到所有命中的 (枚举, 类别)。
+"""
+
+import re
+import sys
+from dataclasses import fields
+from typing import Any, Callable, Dict, Generic, Iterable, List, Mapping, Tuple, TypeVar
+
+E = TypeVar("E")
+R = TypeVar("R")
+
+
+def freeze_features(
+    features: Mapping[E, Mapping[str, Iterable[str]]],
+    record: Callable[..., R],
+) -> Dict[E, R]:
+    """
+    将 {枚举: {类别: [特征词]}} 字面量转换为 {枚举: 特征记录}
+
+    特征词统一转为小写并 intern 后冻结为 frozenset，成员判断为 O(1) 哈希查找，
+    且与进程中其他相同字符串共享存储。
+
+    Args:
+        features: 特征表字面量
+        record: 特征记录类，类别名即字段名
+    """
+    return {
+        owner: record(**{
+            category: frozenset(sys.intern(token.lower()) for token in tokens)
+            for category, tokens in categories.items()
+        })
+        for owner, categories in features.items()
+    }
+
+
+def build_token_index(features: Mapping[E, Any]) -> Dict[str, Tuple[Tuple[E, str], ...]]:
+    """
+    构建反向索引：小写特征词 -> 所属的 (枚举, 类别) 元组
+
+    同一特征词可以属于多个枚举（如 langchain 同时属于 Agent 框架和 RAG 系统），
+    因此值为元组，按特征表中的出现顺序排列。
+    """
+    owners: Dict[str, List[Tuple[E, str]]] = {}
+    for owner, record in features.items():
+        for field in fields(record):
+            for token in getattr(record, field.name):
+                owners.setdefault(token, []).append((owner, field.name))
+    return {token: tuple(entries) for token, entries in owners.items()}
+
+
+class FeatureMatcher(Generic[E]):
+    """
+    特征表匹配器
+
+    按长度降序将反向索引中的特征词组成交替式（较长的词优先匹配）。
+
+    边界规则（两侧一致）：特征词前后都不能紧邻字母、数字、下划线或点，
+    避免 "api" 命中 "rapid"、"app.py" 命中 "app.pyc"；"/"、"-"、空白等
+    视为分隔符，因此 "my-api/app.py" 命中 "api"，"django-rest" 命中 "django"。
+    以 "/" 结尾的目录标记（如 "bin/"、"helm/"）自带分隔符，右侧不再检查，
+    可命中该目录下的任意路径（如 "helm/values.yaml"）。
+    """
+
+    def __init__(self, token_index: Mapping[str, Tuple[Tuple[E, str], ...]]) -> None:
+        self._owners = token_index
+        alternation = "|".join(
+            re.escape(token) if token.endswith("/") else rf"{re.escape(token)}(?![\w.])"
+            for token in sorted(token_index, key=lambda token: (-len(token), token))
+        )
+        self._pattern = re.compile(rf"(?<![\w.])(?:{alternation})")
+
+    def match(self, text: str) -> List[Tuple[E, str]]:
+        """
+        扫描文本，返回命中的 (枚举, 类别) 列表（按首次出现顺序去重）。
+
+        Args:
+            text: 文件路径、目录名或依赖清单等文本（大小写不敏感）
+        """
+        matches: Dict[Tuple[E, str], None] = {}
+        for found in self._pattern.finditer(text.lower()):
+            for owner in self._owners[found.group()]:
+                matches.setdefault(owner)
+        return list(matches)
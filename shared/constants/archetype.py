@@ -4,40 +4,96 @@
 定义支持的项目类型（archetype），用于问题模版选择和分析定制。
 """
 
-from enum import Enum
-from typing import Dict, List
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
+from ._feature_matcher import FeatureMatcher, build_token_index, freeze_features
 
-class ProjectArchetype(str, Enum):
+
+class ProjectArchetype(IntEnum):
     """项目原型枚举"""
     
-    WEB_BACKEND = "web_backend"
+    WEB_BACKEND = 0
     """Web 后端项目 - FastAPI, Django, Flask, Express 等"""
     
-    LIBRARY = "library"
+    LIBRARY = 1
     """库/SDK 项目 - 供其他项目依赖的库"""
     
-    AGENT_FRAMEWORK = "agent_framework"
+    AGENT_FRAMEWORK = 2
     """Agent 框架项目 - LangGraph, AutoGen, CrewAI 等"""
     
-    RAG_SYSTEM = "rag_system"
+    RAG_SYSTEM = 3
     """RAG 系统项目 - 检索增强生成系统"""
     
-    FRONTEND_SPA = "frontend_spa"
+    FRONTEND_SPA = 4
     """前端 SPA 项目 - React, Vue, Angular 等"""
     
-    CLI_TOOL = "cli_tool"
+    CLI_TOOL = 5
     """CLI 工具项目 - 命令行工具"""
     
-    MICROSERVICE = "microservice"
+    MICROSERVICE = 6
     """微服务项目 - 微服务架构"""
     
-    DATA_PIPELINE = "data_pipeline"
+    DATA_PIPELINE = 7
     """数据管道项目 - ETL、数据处理流水线"""
+    
+    @property
+    def slug(self) -> str:
+        """原型标识（持久化、模版目录和对外接口使用的字符串形式）"""
+        return _SLUGS[self]
+    
+    def __str__(self) -> str:
+        return self.slug
+
+
+# 原型标识，按枚举值（定义顺序）排列
+_SLUGS: Tuple[str, ...] = (
+    "web_backend",
+    "library",
+    "agent_framework",
+    "rag_system",
+    "frontend_spa",
+    "cli_tool",
+    "microservice",
+    "data_pipeline",
+)
+
+# 原型标识 -> 枚举
+_BY_SLUG: Dict[str, ProjectArchetype] = dict(zip(_SLUGS, ProjectArchetype))
+
+
+def archetype_from_slug(slug: str) -> Optional[ProjectArchetype]:
+    """
+    根据原型标识获取枚举
+    
+    Args:
+        slug: 原型标识，如 "web_backend"
+    
+    Returns:
+        对应的枚举，未知标识返回 None
+    """
+    return _BY_SLUG.get(slug)
 
 
-# 原型识别特征
-ARCHETYPE_FEATURES: Dict[ProjectArchetype, Dict[str, List[str]]] = {
+@dataclass(frozen=True, slots=True)
+class ArchetypeFeatures:
+    """原型识别特征（特征词均为小写）"""
+    
+    frameworks: FrozenSet[str]
+    """依赖的框架/库名"""
+    
+    directories: FrozenSet[str]
+    """典型目录名"""
+    
+    files: FrozenSet[str]
+    """典型文件名"""
+
+
+# 原型识别特征（模块加载时冻结为 ArchetypeFeatures）
+ARCHETYPE_FEATURES: Dict[ProjectArchetype, ArchetypeFeatures] = freeze_features({
     ProjectArchetype.WEB_BACKEND: {
         "frameworks": ["fastapi", "django", "flask", "express", "nestjs", "spring"],
         "directories": ["api", "routes", "controllers", "views", "middleware"],
@@ -78,11 +134,70 @@ ARCHETYPE_FEATURES: Dict[ProjectArchetype, Dict[str, List[str]]] = {
         "directories": ["dags", "pipelines", "tasks", "flows"],
         "files": ["dag.py", "pipeline.py", "workflow.yaml"],
     },
+}, ArchetypeFeatures)
+
+
+# 特征词 -> (原型, 特征类别) 反向索引，模块加载时构建
+_TOKEN_INDEX: Dict[str, Tuple[Tuple[ProjectArchetype, str], ...]] = build_token_index(ARCHETYPE_FEATURES)
+
+
+def lookup_archetype_token(token: str) -> Tuple[Tuple[ProjectArchetype, str], ...]:
+    """
+    查询特征词所属的原型及特征类别
+    
+    Args:
+        token: 特征词，如框架名、目录名或文件名（大小写不敏感）
+    
+    Returns:
+        (原型, 特征类别) 元组；特征词可属于多个原型，未命中时为空元组
+    """
+    return _TOKEN_INDEX.get(token.lower(), ())
+
+
+# 特征文件名 -> 原型（同名文件属于多个原型时取 ARCHETYPE_FEATURES 中靠前的一个）
+_FILE_INDEX: Dict[str, ProjectArchetype] = {
+    token: next(archetype for archetype, category in owners if category == "files")
+    for token, owners in _TOKEN_INDEX.items()
+    if any(category == "files" for _, category in owners)
 }
 
 
+def match_archetype_file(name: str) -> Optional[ProjectArchetype]:
+    """
+    根据文件名识别原型特征文件
+    
+    Args:
+        name: 文件名（或 "bin/" 这类目录标记），大小写不敏感
+    
+    Returns:
+        文件名属于某原型的特征文件时返回该原型，否则返回 None
+    """
+    return _FILE_INDEX.get(name.lower())
+
+
+@lru_cache(maxsize=None)
+def _feature_matcher() -> FeatureMatcher[ProjectArchetype]:
+    """首次使用时将反向索引编译为匹配器"""
+    return FeatureMatcher(_TOKEN_INDEX)
+
+
+def classify_archetype_path(path: str) -> List[Tuple[ProjectArchetype, str]]:
+    """
+    识别路径（或依赖清单文本）命中的原型特征
+    
+    对输入只做一次正则扫描，而不是逐个原型、逐个类别遍历特征词列表。
+    
+    Args:
+        path: 文件路径、目录名或依赖清单文本（大小写不敏感）
+    
+    Returns:
+        命中的 (原型, 特征类别) 列表，按首次出现顺序去重
+    """
+    return _feature_matcher().match(path)
+
+
 # 原型描述
-ARCHETYPE_DESCRIPTIONS: Dict[ProjectArchetype, str] = {
+ARCHETYPE_DESCRIPTIONS: Mapping[ProjectArchetype, str] = MappingProxyType({
     ProjectArchetype.WEB_BACKEND: "Web 后端服务，处理 HTTP 请求，提供 API 接口",
     ProjectArchetype.LIBRARY: "可复用的库或 SDK，供其他项目引用",
     ProjectArchetype.AGENT_FRAMEWORK: "AI Agent 框架，支持多智能体编排和工具调用",
@@ -91,5 +206,13 @@ ARCHETYPE_DESCRIPTIONS: Dict[ProjectArchetype, str] = {
     ProjectArchetype.CLI_TOOL: "命令行工具，通过终端交互",
     ProjectArchetype.MICROSERVICE: "微服务架构，分布式系统组件",
     ProjectArchetype.DATA_PIPELINE: "数据处理管道，ETL 或流处理系统",
-}
+})
+
+# 描述按枚举值存为元组，describe_archetype 以枚举直接索引
+_ARCHETYPE_DESCRIPTIONS: Tuple[str, ...] = tuple(ARCHETYPE_DESCRIPTIONS[member] for member in ProjectArchetype)
+
+
+def describe_archetype(member: ProjectArchetype) -> str:
+    """获取原型描述"""
+    return _ARCHETYPE_DESCRIPTIONS[member]
 
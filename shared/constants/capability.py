@@ -4,63 +4,125 @@
 定义可识别和深挖学习的能力模块。
 """
 
-from enum import Enum
-from typing import Dict, List
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
+from ._feature_matcher import FeatureMatcher, build_token_index, freeze_features
 
-class CapabilityModule(str, Enum):
+
+class CapabilityModule(IntEnum):
     """能力模块枚举"""
     
     # Agent 相关
-    AGENT_HARNESS = "agent_harness"
+    AGENT_HARNESS = 0
     """Agent 运行时/编排框架"""
     
-    TOOL_SYSTEM = "tool_system"
+    TOOL_SYSTEM = 1
     """工具系统 - 工具注册、调用、管理"""
     
-    STATE_MANAGEMENT = "state_management"
+    STATE_MANAGEMENT = 2
     """状态管理 - Agent 状态持久化和流转"""
     
     # 系统能力
-    PLUGIN_SYSTEM = "plugin_system"
+    PLUGIN_SYSTEM = 3
     """插件/扩展系统"""
     
-    MIDDLEWARE_PIPELINE = "middleware_pipeline"
+    MIDDLEWARE_PIPELINE = 4
     """中间件管道"""
     
-    EVENT_SYSTEM = "event_system"
+    EVENT_SYSTEM = 5
     """事件系统 - 发布/订阅"""
     
     # 数据处理
-    CACHE_LAYER = "cache_layer"
+    CACHE_LAYER = 6
     """缓存层"""
     
-    DATA_ACCESS = "data_access"
+    DATA_ACCESS = 7
     """数据访问层 - Repository、ORM"""
     
     # 安全和运维
-    AUTH_SYSTEM = "auth_system"
+    AUTH_SYSTEM = 8
     """认证/授权系统"""
     
-    ERROR_HANDLING = "error_handling"
+    ERROR_HANDLING = 9
     """错误处理机制"""
     
-    OBSERVABILITY = "observability"
+    OBSERVABILITY = 10
     """可观测性 - 日志、指标、追踪"""
     
     # 通信
-    API_LAYER = "api_layer"
+    API_LAYER = 11
     """API 层 - 路由、序列化"""
     
-    MESSAGING = "messaging"
+    MESSAGING = 12
     """消息队列集成"""
     
-    REALTIME = "realtime"
+    REALTIME = 13
     """实时通信 - WebSocket"""
+    
+    @property
+    def slug(self) -> str:
+        """能力模块标识（持久化、模版目录和对外接口使用的字符串形式）"""
+        return _SLUGS[self]
+    
+    def __str__(self) -> str:
+        return self.slug
+
+
+# 能力模块标识，按枚举值（定义顺序）排列
+_SLUGS: Tuple[str, ...] = (
+    "agent_harness",
+    "tool_system",
+    "state_management",
+    "plugin_system",
+    "middleware_pipeline",
+    "event_system",
+    "cache_layer",
+    "data_access",
+    "auth_system",
+    "error_handling",
+    "observability",
+    "api_layer",
+    "messaging",
+    "realtime",
+)
+
+# 能力模块标识 -> 枚举
+_BY_SLUG: Dict[str, CapabilityModule] = dict(zip(_SLUGS, CapabilityModule))
+
+
+def capability_from_slug(slug: str) -> Optional[CapabilityModule]:
+    """
+    根据能力模块标识获取枚举
+    
+    Args:
+        slug: 能力模块标识，如 "agent_harness"
+    
+    Returns:
+        对应的枚举，未知标识返回 None
+    """
+    return _BY_SLUG.get(slug)
+
+
+@dataclass(frozen=True, slots=True)
+class CapabilityFeatures:
+    """能力模块识别特征（特征词均为小写）"""
+    
+    directories: FrozenSet[str]
+    """典型目录名"""
+    
+    files: FrozenSet[str]
+    """典型文件名"""
+    
+    patterns: FrozenSet[str]
+    """代码中的典型标识符"""
 
 
-# 能力模块识别特征
-CAPABILITY_FEATURES: Dict[CapabilityModule, Dict[str, List[str]]] = {
+# 能力模块识别特征（模块加载时冻结为 CapabilityFeatures）
+CAPABILITY_FEATURES: Dict[CapabilityModule, CapabilityFeatures] = freeze_features({
     CapabilityModule.AGENT_HARNESS: {
         "directories": ["agents", "orchestrator", "runtime", "harness"],
         "files": ["agent.py", "runtime.py", "orchestrator.py"],
@@ -131,11 +193,49 @@ CAPABILITY_FEATURES: Dict[CapabilityModule, Dict[str, List[str]]] = {
         "files": ["websocket.py", "realtime.py"],
         "patterns": ["WebSocket", "socket", "broadcast"],
     },
-}
+}, CapabilityFeatures)
+
+
+# 特征词 -> (能力模块, 特征类别) 反向索引，模块加载时构建
+_TOKEN_INDEX: Dict[str, Tuple[Tuple[CapabilityModule, str], ...]] = build_token_index(CAPABILITY_FEATURES)
+
+
+def lookup_capability_token(token: str) -> Tuple[Tuple[CapabilityModule, str], ...]:
+    """
+    查询特征词所属的能力模块及特征类别
+    
+    Args:
+        token: 特征词，如框架名、目录名或文件名（大小写不敏感）
+    
+    Returns:
+        (能力模块, 特征类别) 元组；特征词可属于多个能力模块，未命中时为空元组
+    """
+    return _TOKEN_INDEX.get(token.lower(), ())
+
+
+@lru_cache(maxsize=None)
+def _feature_matcher() -> FeatureMatcher[CapabilityModule]:
+    """首次使用时将反向索引编译为匹配器"""
+    return FeatureMatcher(_TOKEN_INDEX)
+
+
+def classify_capability_path(path: str) -> List[Tuple[CapabilityModule, str]]:
+    """
+    识别路径（或依赖清单文本）命中的能力模块特征
+    
+    对输入只做一次正则扫描，而不是逐个能力模块、逐个类别遍历特征词列表。
+    
+    Args:
+        path: 文件路径、目录名或依赖清单文本（大小写不敏感）
+    
+    Returns:
+        命中的 (能力模块, 特征类别) 列表，按首次出现顺序去重
+    """
+    return _feature_matcher().match(path)
 
 
 # 能力模块描述
-CAPABILITY_DESCRIPTIONS: Dict[CapabilityModule, str] = {
+CAPABILITY_DESCRIPTIONS: Mapping[CapabilityModule, str] = MappingProxyType({
     CapabilityModule.AGENT_HARNESS: "Agent 运行时框架，负责 Agent 生命周期管理和编排",
     CapabilityModule.TOOL_SYSTEM: "工具系统，管理 Agent 可调用的工具",
     CapabilityModule.STATE_MANAGEMENT: "状态管理，处理 Agent 状态的存储和流转",
@@ -150,5 +250,13 @@ CAPABILITY_DESCRIPTIONS: Dict[CapabilityModule, str] = {
     CapabilityModule.API_LAYER: "API 层，处理外部请求",
     CapabilityModule.MESSAGING: "消息队列，异步通信",
     CapabilityModule.REALTIME: "实时通信，WebSocket 支持",
-}
+})
+
+# 描述按枚举值存为元组，describe_capability 以枚举直接索引
+_CAPABILITY_DESCRIPTIONS: Tuple[str, ...] = tuple(CAPABILITY_DESCRIPTIONS[member] for member in CapabilityModule)
+
+
+def describe_capability(member: CapabilityModule) -> str:
+    """获取能力模块描述"""
+    return _CAPABILITY_DESCRIPTIONS[member]
 
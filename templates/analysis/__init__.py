@@ -13,93 +13,116 @@
 9. 从源码看最佳实践
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
 
 TEMPLATES_DIR = Path(__file__).parent
 
 
-# 章节定义
-ANALYSIS_SECTIONS = {
-    "1_architecture": {
-        "id": "1_architecture",
-        "title": "整体架构分析",
-        "description": "分析项目的整体架构风格、设计原则和分层结构",
-        "template_file": "1_architecture.md",
-    },
-    "2_modules": {
-        "id": "2_modules",
-        "title": "各模块职责与内部关系",
-        "description": "详细说明各模块的职责划分和协作方式",
-        "template_file": "2_modules.md",
-    },
-    "3_core_classes": {
-        "id": "3_core_classes",
-        "title": "核心类解剖",
-        "description": "深入分析核心类的设计和实现",
-        "template_file": "3_core_classes.md",
-    },
-    "4_key_methods": {
-        "id": "4_key_methods",
-        "title": "关键方法深度解析",
-        "description": "解析关键方法的算法逻辑和实现细节",
-        "template_file": "4_key_methods.md",
-    },
-    "5_dependencies": {
-        "id": "5_dependencies",
-        "title": "模块间调用依赖关系分析",
-        "description": "分析模块间的依赖关系和调用链",
-        "template_file": "5_dependencies.md",
-    },
-    "6_core_flows": {
-        "id": "6_core_flows",
-        "title": "核心流程分析",
-        "description": "追踪核心业务流程的实现",
-        "template_file": "6_core_flows.md",
-    },
-    "7_entry_dataflow": {
-        "id": "7_entry_dataflow",
-        "title": "核心入口 & 主要数据流",
-        "description": "分析项目入口和数据流转路径",
-        "template_file": "7_entry_dataflow.md",
-    },
-    "8_highlights": {
-        "id": "8_highlights",
-        "title": "设计亮点与精妙之处",
-        "description": "发现和总结项目的设计亮点",
-        "template_file": "8_highlights.md",
-    },
-    "9_best_practices": {
-        "id": "9_best_practices",
-        "title": "从源码看最佳实践",
-        "description": "从源码中提炼可借鉴的最佳实践",
-        "template_file": "9_best_practices.md",
-    },
-}
+class Section(NamedTuple):
+    """章节定义"""
+    
+    id: str
+    title: str
+    description: str
+    template_file: str
+
+
+# 章节定义（按章节顺序）
+ANALYSIS_SECTIONS: Tuple[Section, ...] = (
+    Section(
+        id="1_architecture",
+        title="整体架构分析",
+        description="分析项目的整体架构风格、设计原则和分层结构",
+        template_file="1_architecture.md",
+    ),
+    Section(
+        id="2_modules",
+        title="各模块职责与内部关系",
+        description="详细说明各模块的职责划分和协作方式",
+        template_file="2_modules.md",
+    ),
+    Section(
+        id="3_core_classes",
+        title="核心类解剖",
+        description="深入分析核心类的设计和实现",
+        template_file="3_core_classes.md",
+    ),
+    Section(
+        id="4_key_methods",
+        title="关键方法深度解析",
+        description="解析关键方法的算法逻辑和实现细节",
+        template_file="4_key_methods.md",
+    ),
+    Section(
+        id="5_dependencies",
+        title="模块间调用依赖关系分析",
+        description="分析模块间的依赖关系和调用链",
+        template_file="5_dependencies.md",
+    ),
+    Section(
+        id="6_core_flows",
+        title="核心流程分析",
+        description="追踪核心业务流程的实现",
+        template_file="6_core_flows.md",
+    ),
+    Section(
+        id="7_entry_dataflow",
+        title="核心入口 & 主要数据流",
+        description="分析项目入口和数据流转路径",
+        template_file="7_entry_dataflow.md",
+    ),
+    Section(
+        id="8_highlights",
+        title="设计亮点与精妙之处",
+        description="发现和总结项目的设计亮点",
+        template_file="8_highlights.md",
+    ),
+    Section(
+        id="9_best_practices",
+        title="从源码看最佳实践",
+        description="从源码中提炼可借鉴的最佳实践",
+        template_file="9_best_practices.md",
+    ),
+)
+
+# 章节 ID -> ANALYSIS_SECTIONS 中的位置
+_ID_INDEX: Dict[str, int] = {section.id: i for i, section in enumerate(ANALYSIS_SECTIONS)}
 
+# 章节 ID -> 章节 的只读视图，由 get_all_sections 直接返回
+_SECTIONS_VIEW: Mapping[str, Section] = MappingProxyType(
+    {section.id: section for section in ANALYSIS_SECTIONS}
+)
 
+
+@lru_cache(maxsize=None)
 def get_section_template(section_id: str) -> Optional[str]:
     """
     获取章节模版内容
     
+    结果按章节 ID 缓存，每个章节的模版文件在进程内只检查、读取一次；
+    模版文件新增或更新后需调用 get_section_template.cache_clear()。
+    
     Args:
         section_id: 章节 ID
     
     Returns:
         str: 模版内容，不存在则返回 None
     """
-    if section_id not in ANALYSIS_SECTIONS:
+    index = _ID_INDEX.get(section_id)
+    if index is None:
         return None
     
-    template_file = TEMPLATES_DIR / ANALYSIS_SECTIONS[section_id]["template_file"]
-    
-    if not template_file.exists():
+    template_file = TEMPLATES_DIR / ANALYSIS_SECTIONS[index].template_file
+    if not template_file.is_file():
         return None
     
     return template_file.read_text(encoding="utf-8")
 
 
-def get_all_sections() -> Dict:
-    """获取所有章节定义"""
-    return ANALYSIS_SECTIONS.copy()
+def get_all_sections() -> Mapping[str, Section]:
+    """获取所有章节定义（章节 ID -> 章节 的只读映射）"""
+    return _SECTIONS_VIEW
 
@@ -10,49 +10,89 @@
 - cli_tool/: CLI 工具项目
 """
 
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
-import yaml
+from typing import Any, Dict, List, Tuple
 
 # 模版目录
 TEMPLATES_DIR = Path(__file__).parent
 
 
+@lru_cache(maxsize=1)
+def _get_yaml() -> Tuple[Any, Any]:
+    """
+    首次加载模版时才导入 yaml，返回 (yaml 模块, Loader)
+    
+    Loader 优先使用 libyaml 实现的 CSafeLoader，未编译 libyaml 时回退到 SafeLoader。
+    """
+    import yaml
+    
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_question_templates(archetype: str) -> List[Dict[str, Any]]:
     """
     加载指定原型的问题模版
     
+    每个原型的 YAML 文件在进程内只解析一次；返回缓存内容的深拷贝，
+    调用方修改列表或其中的模版不影响缓存。
+    
     Args:
         archetype: 项目原型 (web_backend, agent_framework, etc.)
     
     Returns:
         List[Dict]: 问题模版列表
     """
+    return copy.deepcopy(list(_load_question_templates(archetype)))
+
+
+@lru_cache(maxsize=None)
+def _load_question_templates(archetype: str) -> Tuple[Dict[str, Any], ...]:
+    """读取并解析指定原型目录下的 YAML 模版（按原型缓存）"""
     template_dir = TEMPLATES_DIR / archetype
     
-    if not template_dir.exists():
-        return []
+    if not template_dir.is_dir():
+        return ()
+    
+    with os.scandir(template_dir) as entries:
+        paths = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+        )
+    
+    # 所有文件拼接为一个多文档流，只创建一次解析器
+    sources = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            sources.append(f.read())
     
     templates = []
     
-    for yaml_file in template_dir.glob("*.yaml"):
-        with open(yaml_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if isinstance(data, list):
-                templates.extend(data)
-            elif isinstance(data, dict):
-                templates.append(data)
+    yaml, loader = _get_yaml()
+    for data in yaml.load_all("\n---\n".join(sources), Loader=loader):
+        if isinstance(data, list):
+            templates.extend(data)
+        elif isinstance(data, dict):
+            templates.append(data)
     
-    return templates
+    return tuple(templates)
 
 
 def get_available_archetypes() -> List[str]:
     """获取所有可用的项目原型"""
-    archetypes = []
-    
-    for item in TEMPLATES_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith("_"):
-            archetypes.append(item.name)
-    
-    return archetypes
+    return list(_get_available_archetypes())
+
 
+@lru_cache(maxsize=1)
+def _get_available_archetypes() -> Tuple[str, ...]:
+    """扫描模版目录下的原型子目录（运行期间目录内容不变，只扫描一次）"""
+    # DirEntry 自带目录项类型，判断是否为目录无需再 stat；不跟随符号链接
+    with os.scandir(TEMPLATES_DIR) as entries:
+        return tuple(
+            entry.name
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("_")
+        )
@@ -6,6 +6,8 @@
 """
 
 import asyncio
+from collections import Counter, defaultdict
+from operator import attrgetter
 from pathlib import Path
 from infrastructure.code_analysis.tree_sitter_parser import parser, SymbolKind
 
@@ -37,10 +39,13 @@ async def main():
         print(f"✅ 成功提取 {len(symbols)} 个符号\n")
 
         # 按类型统计
-        kind_counts = {}
+        # attrgetter 在 C 层取 kind.value，计数循环不经过 Python 生成器
+        kind_counts = Counter(map(attrgetter("kind.value"), symbols))
+
+        # 按父符号分组，后续按类名直接取子符号
+        symbols_by_parent = defaultdict(list)
         for symbol in symbols:
-            kind_name = symbol.kind.value
-            kind_counts[kind_name] = kind_counts.get(kind_name, 0) + 1
+            symbols_by_parent[symbol.parent].append(symbol)
 
         print("📊 符号类型统计:")
         for kind, count in sorted(kind_counts.items()):
@@ -105,7 +110,9 @@ async def main():
             print(f"   包含方法数: {len(search_service_class.children)}")
 
             # 列出所有方法
-            methods = [s for s in symbols if s.parent == "SymbolSearchService" and s.kind == SymbolKind.METHOD]
+            methods = [
+                s for s in symbols_by_parent["SymbolSearchService"] if s.kind == SymbolKind.METHOD
+            ]
             print(f"   方法列表:")
             for method in methods:
                 print(f"     - {method.name}()")
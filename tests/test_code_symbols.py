@@ -13,9 +13,8 @@ from infrastructure.code_analysis.symbol_search import SymbolSearchService
 @pytest.mark.asyncio
 async def test_python_symbol_extraction(tmp_path: Path) -> None:
     file_path = tmp_path / "module.py"
-    file_path.write_text(
-        """class Foo:\n    def method(self):\n        return 1\n\n\ndef func():\n    return 2\n""",
-        encoding="utf-8",
+    file_path.write_bytes(
+        b"class Foo:\n    def method(self):\n        return 1\n\n\ndef func():\n    return 2\n"
     )
 
     symbols = await parser.parse_file(str(file_path))
@@ -32,12 +31,9 @@ async def test_python_symbol_extraction(tmp_path: Path) -> None:
 @pytest.mark.asyncio
 async def test_typescript_symbol_extraction(tmp_path: Path) -> None:
     file_path = tmp_path / "module.ts"
-    file_path.write_text(
-        (
-            "export class Bar\n{\n  baz(): number { return 1; }\n}" "\n\n"
-            "export function qux(): void { }\n"
-        ),
-        encoding="utf-8",
+    file_path.write_bytes(
+        b"export class Bar\n{\n  baz(): number { return 1; }\n}" b"\n\n"
+        b"export function qux(): void { }\n"
     )
 
     symbols = await parser.parse_file(str(file_path))
@@ -52,8 +48,8 @@ async def test_typescript_symbol_extraction(tmp_path: Path) -> None:
 async def test_symbol_search_by_name(tmp_path: Path) -> None:
     repo_root = tmp_path / "repo"
     repo_root.mkdir()
-    (repo_root / "a.py").write_text("def alpha():\n    return 1\n", encoding="utf-8")
-    (repo_root / "b.py").write_text("def beta():\n    return 2\n", encoding="utf-8")
+    (repo_root / "a.py").write_bytes(b"def alpha():\n    return 1\n")
+    (repo_root / "b.py").write_bytes(b"def beta():\n    return 2\n")
 
     service = SymbolSearchService(project_id="proj-test")
     await service.index_repository(str(repo_root))
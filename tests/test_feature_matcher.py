@@ -0,0 +1,86 @@
+"""Tests for archetype/capability feature matching."""
+
+from __future__ import annotations
+
+import pytest
+
+from shared.constants._feature_matcher import FeatureMatcher
+from shared.constants.archetype import (
+    ProjectArchetype as A,
+    classify_archetype_path,
+    lookup_archetype_token,
+)
+from shared.constants.capability import CapabilityModule as C, classify_capability_path
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # directory markers ending in "/" match paths inside the directory
+        ("kubernetes/deploy.yaml", [(A.MICROSERVICE, "files")]),
+        ("helm/values.yaml", [(A.MICROSERVICE, "files")]),
+        ("bin/tool", [(A.CLI_TOOL, "files")]),
+        ("project/bin/", [(A.CLI_TOOL, "files")]),
+        ("sbin/tool", []),
+        # "-" is a separator on both sides
+        ("my-api/app.py", [(A.WEB_BACKEND, "directories"), (A.WEB_BACKEND, "files")]),
+        ("django-rest", [(A.WEB_BACKEND, "frameworks")]),
+        # no partial-word or extension matches
+        ("rapid/app.pyc", []),
+        ("docs/README.md", []),
+        # case-insensitive, longest token wins
+        ("web/src/App.tsx", [(A.LIBRARY, "directories"), (A.FRONTEND_SPA, "files")]),
+        (
+            "src/agents/graph.py",
+            [
+                (A.LIBRARY, "directories"),
+                (A.AGENT_FRAMEWORK, "directories"),
+                (A.AGENT_FRAMEWORK, "files"),
+            ],
+        ),
+        # requirements text; langchain belongs to two archetypes
+        (
+            "fastapi==0.110.0\nlangchain>=0.1\nlangchain-openai\n",
+            [
+                (A.WEB_BACKEND, "frameworks"),
+                (A.AGENT_FRAMEWORK, "frameworks"),
+                (A.RAG_SYSTEM, "frameworks"),
+            ],
+        ),
+    ],
+)
+def test_classify_archetype_path(text: str, expected: list) -> None:
+    assert classify_archetype_path(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "app/middleware/auth.py",
+            [
+                (C.MIDDLEWARE_PIPELINE, "directories"),
+                (C.MIDDLEWARE_PIPELINE, "patterns"),
+                (C.AUTH_SYSTEM, "files"),
+            ],
+        ),
+        ("lib/redis_cache.py", [(C.CACHE_LAYER, "files")]),
+        ("lib/cache_utils.py", []),
+    ],
+)
+def test_classify_capability_path(text: str, expected: list) -> None:
+    assert classify_capability_path(text) == expected
+
+
+def test_multi_owner_token_lookup() -> None:
+    assert lookup_archetype_token("LangChain") == (
+        (A.AGENT_FRAMEWORK, "frameworks"),
+        (A.RAG_SYSTEM, "frameworks"),
+    )
+    assert lookup_archetype_token("unknown") == ()
+
+
+def test_matcher_deduplicates_in_first_seen_order() -> None:
+    matcher = FeatureMatcher({"b": (("B", "x"),), "a": (("A", "x"), ("B", "x"))})
+
+    assert matcher.match("a b a") == [("A", "x"), ("B", "x")]
@@ -2,55 +2,77 @@
 
 from __future__ import annotations
 
-import os
+import asyncio
 import subprocess
 from pathlib import Path
 
 import pytest
 
-from infrastructure.code_analysis.git_service import GitService, GitCloneError, GitOperationError
+from infrastructure.code_analysis.git_service import (
+    GitCloneError,
+    GitOperationError,
+    GitService,
+    RepoInfo,
+)
+
+
+_FOO_SOURCE = b"class Foo:\n    def bar(self):\n        return 1\n"
 
 
 def _init_local_repo(repo_dir: Path) -> None:
-    """Create a minimal local git repository for testing."""
+    """Create a minimal local git repository for testing.
+
+    The single commit is written with one ``git fast-import`` stream instead
+    of separate ``git add``/``git commit`` calls. The working tree is left
+    empty; only the committed ``foo.py`` is needed for cloning.
+    """
 
     repo_dir.mkdir(parents=True, exist_ok=True)
-    env = os.environ.copy()
-    env.setdefault("GIT_AUTHOR_NAME", "tester")
-    env.setdefault("GIT_AUTHOR_EMAIL", "tester@example.com")
-    env.setdefault("GIT_COMMITTER_NAME", "tester")
-    env.setdefault("GIT_COMMITTER_EMAIL", "tester@example.com")
-
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True, capture_output=True, env=env)
-    (repo_dir / "foo.py").write_text(
-        """class Foo:\n    def bar(self):\n        return 1\n""", encoding="utf-8"
+    message = b"init"
+    stream = b"".join(
+        [
+            b"blob\nmark :1\n",
+            b"data %d\n%s\n" % (len(_FOO_SOURCE), _FOO_SOURCE),
+            b"commit refs/heads/main\n",
+            b"committer tester <tester@example.com> now\n",
+            b"data %d\n%s\n" % (len(message), message),
+            b"M 100644 :1 foo.py\n",
+        ]
     )
-    subprocess.run(["git", "add", "foo.py"], cwd=repo_dir, check=True, capture_output=True, env=env)
+
     subprocess.run(
-        [
-            "git",
-            "commit",
-            "-m",
-            "init",
-        ],
+        ["git", "init", "-b", "main"], cwd=repo_dir, check=True, capture_output=True
+    )
+    subprocess.run(
+        ["git", "fast-import", "--quiet", "--date-format=now"],
         cwd=repo_dir,
+        input=stream,
         check=True,
         capture_output=True,
-        env=env,
     )
 
 
+@pytest.fixture(scope="session")
+def template_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A local git repository shared by the whole session.
+
+    Cloning only reads the source repository, so tests can clone from the
+    same one instead of running ``git init/add/commit`` each time.
+    """
+
+    repo_dir = tmp_path_factory.mktemp("template_repo")
+    _init_local_repo(repo_dir)
+    return repo_dir
+
+
 @pytest.mark.asyncio
-async def test_clone_and_read_files(tmp_path: Path) -> None:
+async def test_clone_and_read_files(tmp_path: Path, template_repo: Path) -> None:
     """GitService should clone a local repository and list/read files."""
 
-    source_repo = tmp_path / "source_repo"
-    _init_local_repo(source_repo)
-
     workspace = tmp_path / "workspace"
     git_service = GitService(workspace_dir=str(workspace))
 
-    repo_info = await git_service.clone_repo(str(source_repo))
+    repo_info = await git_service.clone_repo(str(template_repo))
 
     assert Path(repo_info.local_path).exists()
 
@@ -62,51 +84,53 @@ async def test_clone_and_read_files(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_clone_respects_size_limit(tmp_path: Path) -> None:
+async def test_clone_respects_size_limit(tmp_path: Path, template_repo: Path) -> None:
     """Clone should fail with REPO_TOO_LARGE when repo exceeds configured limit."""
 
-    source_repo = tmp_path / "big_repo"
-    _init_local_repo(source_repo)
-
     workspace = tmp_path / "workspace2"
     git_service = GitService(workspace_dir=str(workspace))
     # 强制设置极小的大小上限以触发限制逻辑
     git_service.max_repo_size_bytes = 1
 
     with pytest.raises(GitCloneError) as exc:
-        await git_service.clone_repo(str(source_repo))
+        await git_service.clone_repo(str(template_repo))
 
     assert exc.value.code == "REPO_TOO_LARGE"
 
 
 @pytest.mark.asyncio
-async def test_invalid_target_name_rejected(tmp_path: Path) -> None:
+async def test_invalid_target_name_rejected(tmp_path: Path, template_repo: Path) -> None:
     """Unsafe target_name values must be rejected to avoid path traversal."""
 
-    source_repo = tmp_path / "source_repo3"
-    _init_local_repo(source_repo)
-
     workspace = tmp_path / "workspace3"
     git_service = GitService(workspace_dir=str(workspace))
 
     with pytest.raises(GitOperationError):
-        await git_service.clone_repo(str(source_repo), target_name="../evil")
+        await git_service.clone_repo(str(template_repo), target_name="../evil")
 
 
-@pytest.mark.asyncio
-async def test_clone_real_github_repo(tmp_path: Path) -> None:
-    """Test cloning a real GitHub repository: code-learning project."""
+REAL_REPO_URL = "https://github.com/longyunfeigu/code-learning"
+
 
-    workspace = tmp_path / "workspace_real"
-    git_service = GitService(workspace_dir=str(workspace), default_depth=1)
+@pytest.fixture(scope="session")
+def cloned_real_repo(tmp_path_factory: pytest.TempPathFactory) -> RepoInfo:
+    """Clone the real GitHub repository once (full history) for all network tests."""
 
-    # Clone the real repository
-    repo_url = "https://github.com/longyunfeigu/code-learning"
-    repo_info = await git_service.clone_repo(repo_url)
+    workspace = tmp_path_factory.mktemp("workspace_real")
+    git_service = GitService(workspace_dir=str(workspace))
+    return asyncio.run(git_service.clone_repo(REAL_REPO_URL, depth=0))
+
+
+@pytest.mark.network
+async def test_clone_real_github_repo(cloned_real_repo: RepoInfo) -> None:
+    """Test cloning a real GitHub repository: code-learning project."""
+
+    repo_info = cloned_real_repo
+    git_service = GitService(workspace_dir=str(Path(repo_info.local_path).parent))
 
     # Verify basic repository info
     assert repo_info is not None
-    assert repo_info.url == repo_url
+    assert repo_info.url == REAL_REPO_URL
     assert repo_info.local_path is not None
     assert Path(repo_info.local_path).exists()
     assert (Path(repo_info.local_path) / ".git").exists()
@@ -116,7 +140,6 @@ async def test_clone_real_github_repo(tmp_path: Path) -> None:
     assert repo_info.last_commit is not None
     assert len(repo_info.last_commit) == 40  # Git commit hash length
     assert repo_info.last_commit_date is not None
-    assert repo_info.clone_depth == 1
 
     # List files in the repository
     files = await git_service.list_files(repo_info.local_path)
@@ -134,33 +157,46 @@ async def test_clone_real_github_repo(tmp_path: Path) -> None:
         assert len(content) > 0
 
 
-@pytest.mark.asyncio
-async def test_clone_real_repo_with_specific_branch(tmp_path: Path) -> None:
-    """Test cloning a specific branch from a real repository."""
+@pytest.mark.network
+@pytest.mark.parametrize("depth", [1, 0])
+async def test_clone_real_repo_with_specific_branch(
+    tmp_path: Path, cloned_real_repo: RepoInfo, depth: int
+) -> None:
+    """Test cloning a specific branch, shallow and full, from the real repository.
+
+    Clones from the session clone through a ``file://`` URL so ``--depth`` is
+    honoured without downloading the repository again.
+    """
 
     workspace = tmp_path / "workspace_branch"
-    git_service = GitService(workspace_dir=str(workspace), default_depth=1)
+    git_service = GitService(workspace_dir=str(workspace))
 
-    repo_url = "https://github.com/longyunfeigu/code-learning"
-    # Try to clone the main branch explicitly
-    repo_info = await git_service.clone_repo(repo_url, branch="main")
+    source_url = Path(cloned_real_repo.local_path).as_uri()
+    repo_info = await git_service.clone_repo(source_url, branch="main", depth=depth)
 
     assert repo_info is not None
     assert Path(repo_info.local_path).exists()
     # Verify we're on the requested branch
     assert repo_info.default_branch == "main"
+    assert repo_info.clone_depth == depth
+    assert repo_info.last_commit == cloned_real_repo.last_commit
+
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD"],
+        cwd=repo_info.local_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if depth == 1:
+        assert int(result.stdout) == 1
 
 
-@pytest.mark.asyncio
-async def test_clone_real_repo_full_depth(tmp_path: Path) -> None:
+@pytest.mark.network
+async def test_clone_real_repo_full_depth(cloned_real_repo: RepoInfo) -> None:
     """Test cloning a real repository with full history (no depth limit)."""
 
-    workspace = tmp_path / "workspace_full"
-    git_service = GitService(workspace_dir=str(workspace))
-
-    repo_url = "https://github.com/longyunfeigu/code-learning"
-    # Clone with full history by passing depth=0 (no --depth flag added)
-    repo_info = await git_service.clone_repo(repo_url, depth=0)
+    repo_info = cloned_real_repo
 
     assert repo_info is not None
     assert Path(repo_info.local_path).exists()
@@ -0,0 +1,43 @@
+"""Tests for the cached code-chunk retrieval helper."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from langchain_core.documents import Document
+
+from infrastructure.langchain import retrievers
+
+
+@pytest.fixture(autouse=True)
+def _empty_query_cache() -> Iterator[None]:
+    retrievers.clear_query_cache()
+    yield
+    retrievers.clear_query_cache()
+
+
+async def test_cached_results_are_isolated_from_callers(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    async def fake_retrieve(project_id, query, search_k, search_type):
+        nonlocal calls
+        calls += 1
+        return [Document(page_content="def login(): ...", metadata={"file_path": "auth.py"})]
+
+    monkeypatch.setattr(retrievers, "_retrieve_code_chunks", fake_retrieve)
+
+    first = await retrievers.retrieve_code_chunks("proj", "login", search_k=1)
+    first[0].metadata["file_path"] = "changed.py"
+    first[0].page_content = "trimmed"
+    first.clear()
+
+    second = await retrievers.retrieve_code_chunks("proj", "login", search_k=1)
+    second[0].metadata["score"] = 0.5
+
+    third = await retrievers.retrieve_code_chunks("proj", "login", search_k=1)
+
+    assert calls == 1
+    assert [(doc.page_content, doc.metadata) for doc in third] == [
+        ("def login(): ...", {"file_path": "auth.py"})
+    ]